@@ -0,0 +1,60 @@
+"""Shared HTTP clients with connection pooling for HTTP-based providers.
+
+Providers that accept an externally managed HTTP client should use these
+singletons so keep-alive sockets (and the TCP+TLS handshakes they amortize)
+are shared across provider instances instead of re-created per client.
+Pool sizes are tunable through the AISUITE_POOL_MAX_CONN and
+AISUITE_POOL_KEEPALIVE environment variables.
+"""
+import functools
+import os
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+
+    def dump_json(data) -> bytes:
+        """Serialize a request payload to JSON bytes."""
+        return orjson.dumps(data)
+
+    def load_json(raw):
+        """Parse a JSON response body."""
+        return orjson.loads(raw)
+except ImportError:
+    # orjson is an optional speedup; fall back to the stdlib codec.
+    import json
+
+    def dump_json(data) -> bytes:
+        """Serialize a request payload to JSON bytes."""
+        return json.dumps(data).encode("utf-8")
+
+    def load_json(raw):
+        """Parse a JSON response body."""
+        return json.loads(raw)
+
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_keepalive_connections=int(os.getenv("AISUITE_POOL_KEEPALIVE", "20")),
+        max_connections=int(os.getenv("AISUITE_POOL_MAX_CONN", "100")),
+        keepalive_expiry=30.0,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_sync_client() -> httpx.Client:
+    """Return the process-wide pooled synchronous HTTP client."""
+    return httpx.Client(limits=_pool_limits(), http2=_HTTP2_AVAILABLE)
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled asynchronous HTTP client."""
+    return httpx.AsyncClient(limits=_pool_limits(), http2=_HTTP2_AVAILABLE)
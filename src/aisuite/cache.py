@@ -0,0 +1,147 @@
+"""Prompt caching for chat providers.
+
+Provides a two-tier cache around ``chat_completions_create``: an exact-match
+tier keyed on a sha256 of the request payload for deterministic
+(``temperature=0``) calls, and an optional embedding-based semantic tier that
+returns a cached response when a previous prompt is similar enough.
+"""
+import abc
+import hashlib
+import json
+import math
+import time
+import typing
+from collections import OrderedDict
+
+from aisuite.framework.chat_provider import ChatProvider
+from aisuite.framework.chat_completion_response import ChatCompletionResponse
+
+try:
+    # Optional speedup: orjson sorts and serializes the payload several times
+    # faster than the stdlib codec on key computation.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def make_cache_key(model, messages, tools=None, temperature=None) -> str:
+    """Build a deterministic cache key from the full request payload."""
+    request = {"model": model, "messages": messages, "tools": tools, "temperature": temperature}
+    if orjson is not None:
+        payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        payload = json.dumps(request, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class LLMCache(abc.ABC):
+    """Storage backend for cached chat completions (memory, Redis, file, ...)."""
+
+    @abc.abstractmethod
+    def get(self, key: str) -> typing.Optional[ChatCompletionResponse]:
+        pass
+
+    @abc.abstractmethod
+    def set(self, key: str, value: ChatCompletionResponse):
+        pass
+
+
+class MemoryLLMCache(LLMCache):
+    """In-process LRU backend with an optional time-to-live."""
+
+    def __init__(self, maxsize: int = 256, ttl: typing.Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, ChatCompletionResponse]]" = OrderedDict()
+
+    def get(self, key: str) -> typing.Optional[ChatCompletionResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: ChatCompletionResponse):
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def _cosine_similarity(a, b) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(y * y for y in b))
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+class CachingChatProvider(ChatProvider):
+    """Wraps a ChatProvider with exact-match and semantic prompt caching.
+
+    The exact tier is consulted for ``temperature=0`` requests. When an
+    ``embedder`` callable (prompt text -> vector) is supplied, non-zero
+    temperature requests go through the semantic tier and are served from
+    cache when a previous request with the same model and tools has a prompt
+    whose cosine similarity reaches ``similarity_threshold``.
+    """
+
+    def __init__(self, provider: ChatProvider, cache: typing.Optional[LLMCache] = None,
+                 embedder: typing.Optional[typing.Callable[[str], typing.Sequence[float]]] = None,
+                 similarity_threshold: float = 0.95,
+                 semantic_maxsize: int = 256):
+        self.provider = provider
+        self.cache = cache if cache is not None else MemoryLLMCache()
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.semantic_maxsize = semantic_maxsize
+        # Each entry is (scope, vector, response); the scope is a hard filter
+        # so a similar prompt sent to a different model or with different
+        # tools is never served another request's response.
+        self._semantic_entries: typing.List[
+            typing.Tuple[typing.Tuple, typing.Sequence[float], ChatCompletionResponse]] = []
+
+    def chat_completions_create(self, model, messages, tools=None, **kwargs):
+        temperature = kwargs.get("temperature")
+
+        if temperature == 0:
+            key = make_cache_key(model, messages, tools, temperature)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            response = self.provider.chat_completions_create(model, messages, tools, **kwargs)
+            self.cache.set(key, response)
+            return response
+
+        if self.embedder is not None:
+            scope = self._semantic_scope(model, tools)
+            vector = self.embedder(self._prompt_text(messages))
+            for cached_scope, cached_vector, cached_response in self._semantic_entries:
+                if cached_scope == scope and \
+                        _cosine_similarity(vector, cached_vector) >= self.similarity_threshold:
+                    return cached_response
+            response = self.provider.chat_completions_create(model, messages, tools, **kwargs)
+            self._semantic_entries.append((scope, vector, response))
+            while len(self._semantic_entries) > self.semantic_maxsize:
+                del self._semantic_entries[0]
+            return response
+
+        return self.provider.chat_completions_create(model, messages, tools, **kwargs)
+
+    @staticmethod
+    def _semantic_scope(model, tools) -> typing.Tuple:
+        """Non-prompt request identity the semantic tier must match exactly."""
+        if tools is None:
+            return (model, None)
+        if orjson is not None:
+            return (model, orjson.dumps(tools, option=orjson.OPT_SORT_KEYS, default=str))
+        return (model, json.dumps(tools, sort_keys=True, default=str))
+
+    @staticmethod
+    def _prompt_text(messages) -> str:
+        return "\n".join(str(message.get("content", "")) for message in messages)
@@ -1,11 +1,14 @@
 import typing
 
 from aisuite.framework.choice import Choice
+from aisuite.framework.message import Message
 
 
 class ChatCompletionResponse:
     """Used to conform to the response model of OpenAI"""
 
+    __slots__ = ("choices", "id", "object", "created", "model", "usage")
+
     def __init__(self):
         self.choices = [Choice()]  # Adjust the range as needed for more choices
 
@@ -13,4 +16,19 @@ class ChatCompletionResponse:
     def create_completion_response(choices: typing.List[Choice]):
         c = ChatCompletionResponse()
         c.choices = choices
-        return c
\ No newline at end of file
+        return c
+
+
+def new_single_choice_response() -> ChatCompletionResponse:
+    """Build the one-choice response skeleton the normalize_response paths mutate.
+
+    Allocates via __new__ and direct slot assignment, skipping the nested
+    __init__ chain that runs on every provider response.
+    """
+    message = Message.__new__(Message)
+    message.content = None
+    choice = Choice.__new__(Choice)
+    choice.message = message
+    response = ChatCompletionResponse.__new__(ChatCompletionResponse)
+    response.choices = [choice]
+    return response
@@ -1,8 +1,13 @@
 import abc
+import asyncio
+import functools
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 from aisuite.framework.provider_interface import ProviderInterface, Provider
 
+DEFAULT_MAX_CONCURRENCY = 10
+
 
 class ChatProvider(Provider, ABC):
     @abstractmethod
@@ -10,6 +15,47 @@ class ChatProvider(Provider, ABC):
         """Abstract method for chat completion calls, to be implemented by each provider."""
         pass
 
+    def chat_completions_create_batch(self, model, batch_messages, tools=None,
+                                      max_concurrency=DEFAULT_MAX_CONCURRENCY, **kwargs):
+        """Create chat completions for several message histories in one call.
+
+        Providers with a native batch endpoint can override this; the default fans the
+        single-call form out over a bounded thread pool so the N prompts share warm
+        connections instead of issuing N sequential round trips.
+        """
+        if not batch_messages:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batch_messages))) as executor:
+            futures = [executor.submit(self.chat_completions_create, model, messages, tools, **kwargs)
+                       for messages in batch_messages]
+            return [future.result() for future in futures]
+
+class AsyncChatProvider(ChatProvider, ABC):
+    """Chat provider with an awaitable entry point.
+
+    The default implementation runs the sync chat_completions_create on the
+    running loop's executor so callers can fan out over providers without
+    per-call threads; providers whose SDKs ship a native async client should
+    override chat_completions_create_async directly.
+    """
+
+    async def chat_completions_create_async(self, model, messages, tools=None, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.chat_completions_create, model, messages, tools, **kwargs))
+
+
+class AsyncChatAdapter(AsyncChatProvider):
+    """Adapts a sync-only ChatProvider to the AsyncChatProvider interface."""
+
+    def __init__(self, provider: ChatProvider):
+        self.provider = provider
+
+    def chat_completions_create(self, model, messages, tools=None, **kwargs):
+        return self.provider.chat_completions_create(model, messages, tools, **kwargs)
+
+
 DEFAULT_TEMPERATURE = 0.7
 
 class ChatProviderInterface(ProviderInterface):
@@ -35,3 +81,21 @@ class ChatProviderInterface(ProviderInterface):
         raise NotImplementedError(
             "Provider Interface has not implemented chat_completion_create()"
         )
+
+    def chat_completion_create_batch(self, batch_messages=None, model=None, tools=None,
+                                     temperature=DEFAULT_TEMPERATURE,
+                                     max_concurrency=DEFAULT_MAX_CONCURRENCY, **kwargs) \
+            -> "list[ChatCompletionResponse]":
+        """Create chat completions for several message histories, one response per history.
+
+        Falls back to fanning chat_completion_create out over a bounded thread pool;
+        implementations backed by a native batch API should override this.
+        """
+        if not batch_messages:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batch_messages))) as executor:
+            futures = [executor.submit(self.chat_completion_create, messages=messages, model=model,
+                                       tools=tools, temperature=temperature, **kwargs)
+                       for messages in batch_messages]
+            return [future.result() for future in futures]
@@ -2,6 +2,8 @@ from aisuite.framework.message import Message
 
 
 class Choice:
+    __slots__ = ("message", "finish_reason", "index")
+
     def __init__(self):
         self.message = Message()
 
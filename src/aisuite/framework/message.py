@@ -2,5 +2,9 @@
 
 
 class Message:
+    # Slots keep per-response allocations small; optional fields are left unset
+    # until a provider populates them.
+    __slots__ = ("content", "role", "tool_calls", "function_call")
+
     def __init__(self):
         self.content = None
@@ -1,8 +1,5 @@
 import abc
-import dataclasses
-import typing
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
 
 import rerankers.results
 
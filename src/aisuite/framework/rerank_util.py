@@ -1,3 +1,4 @@
+import functools
 import logging
 import typing
 from typing import List, Optional, Union
@@ -13,10 +14,50 @@ except:
     log_info = lambda x: logging.info(f"INFO: {x}")
     log_warn = lambda x: logging.warning(f"WARN: {x}")
 
+# Bound once so hot loops compare against a local name instead of re-resolving
+# the rerankers attribute chain per element.
+_Document = rerankers.results.Document
+
+
 def create_ranking_records(
         docs: Union[str, List[str], rerankers.results.Document, List[rerankers.results.Document]],
 ) -> list[RankingRecord]:
-    if isinstance(docs, str) or isinstance(docs, rerankers.results.Document):
+    docs_type = type(docs)
+
+    # Batches are the common case, so list/tuple is a single pointer compare
+    # away; the isinstance net for str/Document subclasses runs last.
+    if docs_type is list or docs_type is tuple:
+        # Fast path: batches already normalized by rerankers.utils.prep_docs
+        # arrive as a list of Documents with ids assigned; build records
+        # directly instead of re-dispatching and re-deriving ids per element.
+        if docs and type(docs[0]) is _Document:
+            ranking_records = []
+            for i, d in enumerate(docs):
+                record = create_ranking_record(
+                    str(d.doc_id) if d.doc_id is not None else get_doc_id(i), d.text, d.metadata)
+                if record is not None:
+                    ranking_records.append(record)
+            if len(ranking_records) == 0:
+                _log_no_ranking_records()
+            return ranking_records
+
+        # Single pass over the batch: strs take an exact-type fast path that skips
+        # the per-element parse dispatch, and Nones are filtered inline rather than
+        # through a second comprehension + lambda filter. The parse helpers are
+        # bound to locals so the comprehension avoids global lookups per element.
+        _parse = parse_to_ranking_record
+        _create = create_ranking_record
+        _doc_id = get_doc_id
+        ranking_records = [
+            record for record in
+            (_create(_doc_id(i), d, None) if type(d) is str else _parse(d, i)
+             for i, d in enumerate(docs))
+            if record is not None]
+        if len(ranking_records) == 0:
+            _log_no_ranking_records()
+        return ranking_records
+
+    if docs_type is str or docs_type is _Document or isinstance(docs, (str, _Document)):
         record = parse_single_ranking_record(docs)
         if record:
             return [record]
@@ -24,12 +65,9 @@ def create_ranking_records(
             _log_no_ranking_records()
             return []
     elif isinstance(docs, List):
-        ranking_records = [parse_to_ranking_record(d, i)
-                           for i, d in  enumerate(docs)]
-        ranking_records = [record for record in filter(lambda x: x is not None, ranking_records)]
-        if len(ranking_records) == 0:
-            _log_no_ranking_records()
-        return ranking_records
+        # Correctness net for list subclasses; the exact-type branch above
+        # covers plain lists and tuples.
+        return create_ranking_records(list(docs))
     else:
         _log_no_ranking_records()
         return []
@@ -40,59 +78,104 @@ def _log_no_ranking_records():
 
 
 def create_ranking_record(doc_id: str, text: str, metadata: typing.Optional[dict[str, ...]]):
-    title = key_from_metadata_or_none(metadata, "title")
+    title = metadata.get("title") if metadata else None
     if not text and not title:
         log_warn("Rerank must be provided with text or title.")
         return None
 
-    return RankingRecord(
-        id=doc_id,
-        content=text,
-        title=title,
-        score=key_from_metadata_or_none(metadata, "score"))
+    # Direct field assignment skips the generated proto constructor's per-kwarg
+    # dispatch, which dominates Python cost on large batches.
+    record = RankingRecord()
+    record.id = doc_id
+    if text:
+        record.content = text
+    if title:
+        record.title = title
+    score = metadata.get("score") if metadata else None
+    if score is not None:
+        record.score = score
+    return record
 
 
 def key_from_metadata_or_none(metadata, key: str):
-    if metadata:
-        return metadata[key] if key in metadata.keys() else None
+    return metadata.get(key) if metadata else None
+
 
-    return None
+# Single-record parsers dispatched by exact type.
+_SINGLE_PARSERS = {
+    str: lambda d: create_ranking_record("1", d, None),
+    _Document: lambda d: create_ranking_record("1", d.text, d.metadata),
+}
 
 
 def parse_single_ranking_record(
         d: Union[str, rerankers.results.Document],
 ) -> RankingRecord:
-    return create_ranking_record("1", get_doc_text(d), d.metadata)
+    parser = _SINGLE_PARSERS.get(type(d))
+    if parser is not None:
+        return parser(d)
+    return create_ranking_record("1", get_doc_text(d), getattr(d, "metadata", None))
 
 
-def get_doc_text(d: Union[str, rerankers.results.Document]) -> str:
-    if isinstance(d, str):
-        return d
-    elif isinstance(d, rerankers.results.Document):
-        return d.text
-    else:
-        log_warn(f"Get doc called with unkonwn type: {d.__class__.__name__}.")
-        return ""
+# Text extraction and per-element parsing dispatch through singledispatch:
+# after first use its per-type cache resolves at C speed, and Document
+# subclasses still land on the Document implementation.
+@functools.singledispatch
+def get_doc_text(d) -> str:
+    log_warn(f"Get doc called with unkonwn type: {d.__class__.__name__}.")
+    return ""
 
 
-def parse_to_ranking_record(
-        d: Union[str, rerankers.results.Document],
-        i: int
-) -> RankingRecord:
-    if isinstance(d, rerankers.results.Document):
-        return create_ranking_record(get_doc_id(i), get_text(d.text), d.metadata)
-    else:
-        return create_ranking_record(get_doc_id(i), get_text(d), None)
+@get_doc_text.register(str)
+def _(d) -> str:
+    return d
+
+
+@get_doc_text.register(rerankers.results.Document)
+def _(d) -> str:
+    return d.text
+
+
+@functools.singledispatch
+def parse_to_ranking_record(d, i: int) -> RankingRecord:
+    return create_ranking_record(get_doc_id(i), get_text(d), None)
+
+
+@parse_to_ranking_record.register(str)
+def _(d, i: int) -> RankingRecord:
+    return create_ranking_record(get_doc_id(i), d, None)
+
+
+@parse_to_ranking_record.register(_Document)
+def _(d, i: int) -> RankingRecord:
+    return create_ranking_record(get_doc_id(i), get_text(d.text), d.metadata)
+
+# Sentinel for getattr misses; cheaper than hasattr, which catches
+# exceptions internally.
+_MISSING = object()
+
 
 def get_text(d: Union[str, rerankers.results.Document]):
-    if isinstance(d, str):
-        return  d
-    elif isinstance(d, dict):
-        if 'text' in d.keys():
-            return get_text(d['text'])
-    elif hasattr(d, 'text'):
-        d = getattr(d, 'text')
-        return get_text(d)
+    # Iterative unwrap: well-formed Documents terminate within a couple of
+    # levels, and a while loop avoids a full Python frame per level.
+    while True:
+        t = type(d)
+        if t is str:
+            return d
+        if t is dict:
+            d = d.get('text')
+            if d is None:
+                return None
+            continue
+        text = getattr(d, 'text', _MISSING)
+        if text is _MISSING:
+            return None
+        d = text
+
+# Prebuilt id strings for common batch sizes; avoids an int.__str__ and a
+# fresh str allocation per doc on every call.
+_ID_CACHE = [str(i) for i in range(1024)]
+
 
 def get_doc_id(i):
-    return str(i)
+    return _ID_CACHE[i] if i < 1024 else str(i)
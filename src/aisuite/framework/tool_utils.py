@@ -1,5 +1,53 @@
+import json
 import typing
+from collections import OrderedDict
 
-from langchain_core.tools import BaseTool
+try:
+    from langchain_core.tools import BaseTool
+except ImportError:
+    # langchain is an optional dependency; fall back so providers that never
+    # pass BaseTool instances can import this module without it installed.
+    BaseTool = typing.Any
 
-SerializedTools = typing.Sequence[typing.Union[typing.Dict[str, typing.Any], type, BaseTool]]
\ No newline at end of file
+SerializedTools = typing.Sequence[typing.Union[typing.Dict[str, typing.Any], type, BaseTool]]
+
+
+def tool_cache_key(tools: SerializedTools) -> tuple:
+    """Build a hashable content key for converted-tool caches.
+
+    id(tools) is not a sound cache key: CPython recycles ids as soon as the
+    caller's list is garbage-collected, so a later, different tools list can
+    silently be served a stale converted payload. Keying on each tool's
+    fields ties the entry to what was actually converted.
+    """
+    return tuple(
+        (tool["name"], tool.get("description", ""),
+         json.dumps(tool.get("args") or {}, sort_keys=True, default=str))
+        for tool in tools
+    )
+
+
+class ToolConversionCache:
+    """Small LRU of converted tool payloads keyed by ``tool_cache_key``.
+
+    Agent loops pass the same tools every turn, so the hit rate is high, but
+    the set of distinct tool lists over a process lifetime is unbounded;
+    the LRU keeps the cache from growing with it.
+    """
+
+    __slots__ = ("maxsize", "_entries")
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, typing.Any]" = OrderedDict()
+
+    def get(self, key):
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._entries[key] = value
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
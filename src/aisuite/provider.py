@@ -10,7 +10,9 @@ from aisuite.framework.chat_provider import ChatProviderInterface
 from aisuite.framework.chat_provider import ChatProvider
 from aisuite.framework.embedding_provider import EmbeddingProviderInterface, EmbeddingProvider
 from aisuite.framework.provider_interface import Provider, ProviderInterface
-from aisuite.framework.rerank_provider import RerankProviderInterface, RerankProvider
+
+if typing.TYPE_CHECKING:
+    from aisuite.framework.rerank_provider import RerankProviderInterface, RerankProvider
 
 
 class ProviderType(enum.Enum):
@@ -31,15 +33,62 @@ class ProviderFactory:
 
     PROVIDERS_DIR = Path(__file__).parent / "providers"
 
+    # Cache of already-imported provider modules keyed by provider_key.
+    _provider_modules: typing.Dict[str, typing.Any] = {}
+
+    # Registry of resolved provider classes keyed by (provider_key, provider_type).
+    # Populated on first use rather than by an eager scan of PROVIDERS_DIR, since
+    # provider modules import optional SDKs that may not be installed.
+    _provider_classes: typing.Dict[typing.Tuple[str, ProviderType], type] = {}
+
     @classmethod
     def create_provider(cls, provider_key, config, provider_type: ProviderType = ProviderType.CHAT) \
             -> typing.Union[Provider, ProviderInterface]:
-        """Dynamically load and create an instance of a provider based on the naming convention."""
-        # Convert provider_key to the expected module and class names
-        provider_class_name = f"{provider_key.capitalize()}{provider_type.value}Provider"
-        provider_module_name = f"{provider_key}_provider"
+        """Dynamically load and create an instance of a provider based on the naming convention.
+
+        Instances are memoized per (provider_key, provider_type, config) so repeated calls with
+        the same configuration reuse the provider and any SDK clients (and their connection pools)
+        it built in __init__, instead of paying import + client construction again.
+        """
+        # Freeze the config so it can key the instance cache. Configs with unhashable
+        # values (e.g. nested dicts) cannot be cached and fall back to a fresh instance.
+        config_items = tuple(sorted(config.items()))
+        try:
+            hash(config_items)
+        except TypeError:
+            return cls._instantiate_provider(provider_key, provider_type, config)
+
+        return cls._cached_create(provider_key, provider_type, config_items)
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _cached_create(cls, provider_key, provider_type, config_items) \
+            -> typing.Union[Provider, ProviderInterface]:
+        """Memoized provider construction keyed by (provider_key, provider_type, frozen config)."""
+        return cls._instantiate_provider(provider_key, provider_type, dict(config_items))
+
+    @classmethod
+    def _instantiate_provider(cls, provider_key, provider_type, config) \
+            -> typing.Union[Provider, ProviderInterface]:
+        """Instantiate the provider class for the given type, resolving it via the registry."""
+        provider_class = cls._provider_classes.get((provider_key, provider_type))
+        if provider_class is None:
+            # Convert provider_key to the expected class name
+            provider_class_name = f"{provider_key.capitalize()}{provider_type.value}Provider"
+            module = cls._load_provider_module(provider_key)
+            provider_class = getattr(module, provider_class_name)
+            cls._provider_classes[(provider_key, provider_type)] = provider_class
+
+        return provider_class(**config)
+
+    @classmethod
+    def _load_provider_module(cls, provider_key):
+        """Import the provider module for provider_key, reusing previously imported modules."""
+        module = cls._provider_modules.get(provider_key)
+        if module is not None:
+            return module
 
-        module_path = f"aisuite.providers.{provider_module_name}"
+        module_path = f"aisuite.providers.{provider_key}_provider"
 
         # Lazily load the module
         try:
@@ -50,18 +99,39 @@ class ProviderFactory:
         except Exception as o:
             raise Exception(f"Could not import module for some other reason {str(o)}")
 
-
-        # Instantiate the provider class
-        provider_class = getattr(module, provider_class_name)
-        return provider_class(**config)
+        cls._provider_modules[provider_key] = module
+        return module
 
     @classmethod
-    def create_chat_provider(cls, provider_key, config) \
+    def create_chat_provider(cls, provider_key, config, cache=None) \
             -> typing.Union[ChatProviderInterface, ChatProvider]:
-        """Dynamically load and create an instance of a provider based on the naming convention."""
+        """Dynamically load and create an instance of a provider based on the naming convention.
+
+        Pass an aisuite.cache.LLMCache as cache to wrap the provider with prompt caching.
+        """
         # Convert provider_key to the expected module and class names
-        return typing.cast(typing.Union[ChatProviderInterface, ChatProvider],
-                           cls.create_provider(provider_key, config, ProviderType.CHAT))
+        provider = typing.cast(typing.Union[ChatProviderInterface, ChatProvider],
+                               cls.create_provider(provider_key, config, ProviderType.CHAT))
+        if cache is not None:
+            from aisuite.cache import CachingChatProvider
+            provider = CachingChatProvider(provider, cache)
+        return provider
+
+    @classmethod
+    def create_async_chat_provider(cls, provider_key, config) \
+            -> ChatProvider:
+        """Create a chat provider exposing chat_completions_create_async.
+
+        Providers that already subclass AsyncChatProvider are returned directly;
+        sync-only providers are wrapped so the async entry point delegates to
+        the executor-backed default.
+        """
+        from aisuite.framework.chat_provider import AsyncChatProvider, AsyncChatAdapter
+
+        provider = cls.create_provider(provider_key, config, ProviderType.CHAT)
+        if isinstance(provider, AsyncChatProvider):
+            return provider
+        return AsyncChatAdapter(typing.cast(ChatProvider, provider))
 
     @classmethod
     def create_embedding_provider(cls, provider_key, config) \
@@ -73,17 +143,25 @@ class ProviderFactory:
 
     @classmethod
     def create_rerank_provider(cls, provider_key, config) \
-            -> typing.Union[RerankProviderInterface, RerankProvider]:
+            -> typing.Union["RerankProviderInterface", "RerankProvider"]:
         """Dynamically load and create an instance of a provider based on the naming convention."""
+        # Imported here so `import aisuite` does not pull in the rerankers SDK.
+        from aisuite.framework.rerank_provider import RerankProviderInterface, RerankProvider
+
         # Convert provider_key to the expected module and class names
         return typing.cast(typing.Union[RerankProviderInterface, RerankProvider],
                            cls.create_provider(provider_key, config, ProviderType.RERANK))
 
     @classmethod
-    @functools.cache
     def get_supported_providers(cls):
         """List all supported provider names based on files present in the providers directory."""
-        provider_files = Path(cls.PROVIDERS_DIR).glob("*_provider.py")
-        pr = [p for p in provider_files]
-        return {file.stem.replace("_provider", "") for file in pr}
+        return _SUPPORTED_PROVIDERS
+
+
+# Scan the providers directory once at import time so the first
+# get_supported_providers call doesn't block on filesystem I/O; the frozenset
+# is shared by all callers without copying.
+_SUPPORTED_PROVIDERS = frozenset(
+    file.stem.replace("_provider", "")
+    for file in ProviderFactory.PROVIDERS_DIR.glob("*_provider.py"))
 
@@ -2,8 +2,12 @@ import typing
 
 import anthropic
 from aisuite.framework.chat_provider import ChatProvider
-from aisuite.framework import ChatCompletionResponse
-from aisuite.framework.tool_utils import SerializedTools
+from aisuite.framework.chat_completion_response import new_single_choice_response
+from aisuite.framework.tool_utils import (
+    SerializedTools,
+    ToolConversionCache,
+    tool_cache_key,
+)
 
 # Define a constant for the default max_tokens value
 DEFAULT_MAX_TOKENS = 4096
@@ -17,6 +21,11 @@ class AnthropicChatProvider(ChatProvider):
         """
 
         self.client = anthropic.Anthropic(**config)
+        # Pre-resolve the messages.create attribute chain once instead of two
+        # LOAD_ATTRs per completion.
+        self._create = self.client.messages.create
+        # Converted tools payloads keyed by tool content; see AwsChatProvider.
+        self._tool_cache = ToolConversionCache()
 
     def chat_completions_create(self, model, messages,
                                 tools: typing.Optional[SerializedTools] = None,
@@ -33,33 +42,29 @@ class AnthropicChatProvider(ChatProvider):
             kwargs["max_tokens"] = DEFAULT_MAX_TOKENS
 
         if tools:
-            anthropic_tools = self._convert_to_anthropic_tools(tools)
+            tools_key = tool_cache_key(tools)
+            anthropic_tools = self._tool_cache.get(tools_key)
+            if anthropic_tools is None:
+                # Convert the unified tool format to the format that Anthropic
+                # expects; 'args' is assumed to contain the input schema.
+                anthropic_tools = [
+                    {
+                        "name": tool["name"],
+                        "description": tool["description"],
+                        "input_schema": tool["args"],
+                    }
+                    for tool in tools
+                ]
+                self._tool_cache[tools_key] = anthropic_tools
             kwargs["tools"] = anthropic_tools
 
         return self.normalize_response(
-            self.client.messages.create(
+            self._create(
                 model=model, system=system_message, messages=messages, **kwargs
             ))
 
     def normalize_response(self, response):
         """Normalize the response from the Anthropic API to match OpenAI's response format."""
-        normalized_response = ChatCompletionResponse()
+        normalized_response = new_single_choice_response()
         normalized_response.choices[0].message.content = response.content[0].text
         return normalized_response
-
-    def _convert_to_anthropic_tools(self, tools):
-        """
-        Convert the unified tool format to the format that Anthropic expects.
-        """
-        if not tools:
-            return None
-
-        anthropic_tools = []
-        for tool in tools:
-            anthropic_tool = {
-                "name": tool["name"],
-                "description": tool["description"],
-                "input_schema": tool["args"],  # Assuming 'args' contains the input schema
-            }
-            anthropic_tools.append(anthropic_tool)
-        return anthropic_tools
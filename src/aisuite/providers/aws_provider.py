@@ -1,10 +1,15 @@
+import itertools
 import os
 import typing
 
 import boto3
 from aisuite.framework.chat_provider import ChatProvider
-from aisuite.framework import ChatCompletionResponse
-from aisuite.framework.tool_utils import SerializedTools
+from aisuite.framework.chat_completion_response import new_single_choice_response
+from aisuite.framework.tool_utils import (
+    SerializedTools,
+    ToolConversionCache,
+    tool_cache_key,
+)
 
 
 class AwsChatProvider(ChatProvider):
@@ -39,16 +44,16 @@ class AwsChatProvider(ChatProvider):
             "region_name", os.getenv("AWS_REGION_NAME", "us-west-2")
         )
         self.client = boto3.client("bedrock-runtime", region_name=self.region_name)
-        self.inference_parameters = [
-            "maxTokens",
-            "temperature",
-            "topP",
-            "stopSequences",
-        ]
+        self.inference_parameters = frozenset(
+            ("maxTokens", "temperature", "topP", "stopSequences")
+        )
+        # Converted tools payloads keyed by tool content; agent loops pass the
+        # same tools every turn, so the Bedrock format is built once.
+        self._tool_cache = ToolConversionCache()
 
     def normalize_response(self, response):
             """Normalize the response from the Bedrock API to match OpenAI's response format."""
-            norm_response = ChatCompletionResponse()
+            norm_response = new_single_choice_response()
         
             # Extract the message content
             content = response["output"]["message"]["content"][0]["text"]
@@ -80,34 +85,39 @@ class AwsChatProvider(ChatProvider):
         # Maybe we should catch them and raise a custom LLMError.
         # https://docs.aws.amazon.com/bedrock/latest/userguide/conversation-inference.html
         system_message = []
+        start = 0
         if messages[0]["role"] == "system":
             system_message = [{"text": messages[0]["content"]}]
-            messages = messages[1:]
+            start = 1
 
-        formatted_messages = []
-        for message in messages:
-            # QUIETLY Ignore any "system" messages except the first system message.
-            if message["role"] != "system":
-                formatted_messages.append(
-                    {"role": message["role"], "content": [{"text": message["content"]}]}
-                )
+        # Single pass over the remaining messages; islice skips the leading
+        # system message without copying the list the way messages[1:] does.
+        # QUIETLY Ignore any "system" messages except the first system message.
+        formatted_messages = [
+            {"role": message["role"], "content": [{"text": message["content"]}]}
+            for message in itertools.islice(messages, start, None)
+            if message["role"] != "system"
+        ]
 
-        # Maintain a list of Inference Parameters which Bedrock supports.
+        # Maintain a set of Inference Parameters which Bedrock supports.
         # These fields need to be passed using inferenceConfig.
         # Rest all other fields are passed as additionalModelRequestFields.
-        inference_config = {}
-        additional_model_request_fields = {}
-
-        # Iterate over the kwargs and separate the inference parameters and additional model request fields.
-        for key, value in kwargs.items():
-            if key in self.inference_parameters:
-                inference_config[key] = value
-            else:
-                additional_model_request_fields[key] = value
+        inference_parameters = self.inference_parameters
+        inference_config = {
+            key: value for key, value in kwargs.items() if key in inference_parameters
+        }
+        additional_model_request_fields = {
+            key: value
+            for key, value in kwargs.items()
+            if key not in inference_parameters
+        }
                 
         # Format tools for AWS Bedrock if provided
         bedrock_tools = None
         if tools:
+            tools_key = tool_cache_key(tools)
+            bedrock_tools = self._tool_cache.get(tools_key)
+        if tools and bedrock_tools is None:
             bedrock_tools = []
             for tool in tools:
                 bedrock_tool = {
@@ -122,6 +132,7 @@ class AwsChatProvider(ChatProvider):
                     }
                 }
                 bedrock_tools.append(bedrock_tool)
+            self._tool_cache[tools_key] = bedrock_tools
 
         # Call the Bedrock Converse API.
         api_params = {
@@ -1,8 +1,7 @@
 import typing
-import urllib.request
-import json
 import os
 
+from aisuite import _http
 from aisuite.framework.chat_provider import ChatProvider
 from aisuite.framework import ChatCompletionResponse
 from aisuite.framework.tool_utils import SerializedTools
@@ -19,46 +18,49 @@ class AzureChatProvider(ChatProvider):
                 "For Azure, base_url is required. Check your deployment page for a URL like this - https://<model-deployment-name>.<region>.models.ai.azure.com"
             )
 
-    def chat_completions_create(self, model, messages, tools: typing.Optional[SerializedTools]=None, **kwargs):
-        url = f"https://{model}.westus3.models.ai.azure.com/v1/chat/completions"
-        url = f"https://{self.base_url}/chat/completions"
-        if self.base_url:
-            url = f"{self.base_url}/chat/completions"
+        # Optionally set a custom timeout (default to 30s)
+        self.timeout = config.get("timeout", 30)
+
+        # Requests go through the shared pooled client so repeated completions
+        # reuse one TLS session instead of re-handshaking per call.
+        self._client = config.get("client") or _http.get_sync_client()
+
+        # The endpoint URL and headers are constant per provider; build them
+        # once instead of re-formatting on every completion.
+        base_url = self.base_url if "://" in self.base_url else f"https://{self.base_url}"
+        self._url = f"{base_url}/chat/completions"
+        self._headers = {"Content-Type": "application/json", "Authorization": self.api_key}
 
+    def chat_completions_create(self, model, messages, tools: typing.Optional[SerializedTools]=None, **kwargs):
         # Remove 'stream' from kwargs if present
         kwargs.pop("stream", None)
         data = {"messages": messages, **kwargs}
-        
+
         # Add tools to the request if provided
         if tools:
             data["tools"] = tools
 
-        body = json.dumps(data).encode("utf-8")
-        headers = {"Content-Type": "application/json", "Authorization": self.api_key}
+        response = self._client.post(self._url, content=_http.dump_json(data), headers=self._headers,
+                                     timeout=self.timeout)
+        if response.status_code >= 400:
+            error_message = f"The request failed with status code: {response.status_code}\n"
+            error_message += f"Headers: {response.headers}\n"
+            error_message += response.text
+            raise Exception(error_message)
 
-        try:
-            req = urllib.request.Request(url, body, headers)
-            with urllib.request.urlopen(req) as response:
-                result = response.read()
-                resp_json = json.loads(result)
-                completion_response = ChatCompletionResponse()
-                # Extract basic message content
-                completion_response.choices[0].message.content = resp_json["choices"][0]["message"]["content"]
-                
-                # Check for and extract tool calls if present
-                if "tool_calls" in resp_json["choices"][0]["message"]:
-                    completion_response.choices[0].message.tool_calls = resp_json["choices"][0]["message"]["tool_calls"]
-                    completion_response.choices[0].finish_reason = "tool_calls"
-                
-                # Check for and extract function call if present (legacy format)
-                elif "function_call" in resp_json["choices"][0]["message"]:
-                    completion_response.choices[0].message.function_call = resp_json["choices"][0]["message"]["function_call"]
-                    completion_response.choices[0].finish_reason = "function_call"
-                
-                return completion_response
+        resp_json = _http.load_json(response.content)
+        completion_response = ChatCompletionResponse()
+        # Extract basic message content
+        completion_response.choices[0].message.content = resp_json["choices"][0]["message"]["content"]
 
-        except urllib.error.HTTPError as error:
-            error_message = f"The request failed with status code: {error.code}\n"
-            error_message += f"Headers: {error.info()}\n"
-            error_message += error.read().decode("utf-8", "ignore")
-            raise Exception(error_message)
+        # Check for and extract tool calls if present
+        if "tool_calls" in resp_json["choices"][0]["message"]:
+            completion_response.choices[0].message.tool_calls = resp_json["choices"][0]["message"]["tool_calls"]
+            completion_response.choices[0].finish_reason = "tool_calls"
+
+        # Check for and extract function call if present (legacy format)
+        elif "function_call" in resp_json["choices"][0]["message"]:
+            completion_response.choices[0].message.function_call = resp_json["choices"][0]["message"]["function_call"]
+            completion_response.choices[0].finish_reason = "function_call"
+
+        return completion_response
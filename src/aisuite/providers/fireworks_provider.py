@@ -2,13 +2,15 @@ import os
 import typing
 
 import httpx
-from aisuite.framework.chat_provider import ChatProvider
+
+from aisuite import _http
+from aisuite.framework.chat_provider import AsyncChatProvider
 from aisuite.framework.tool_utils import SerializedTools
 from aisuite.provider import LLMError
-from aisuite.framework import ChatCompletionResponse
+from aisuite.framework.chat_completion_response import new_single_choice_response
 
 
-class FireworksChatProvider(ChatProvider):
+class FireworksChatProvider(AsyncChatProvider):
     """
     Fireworks AI Provider using httpx for direct API calls.
     """
@@ -51,7 +53,44 @@ class FireworksChatProvider(ChatProvider):
         try:
             # Make the request to Fireworks AI endpoint.
             response = httpx.post(
-                self.BASE_URL, json=data, headers=headers, timeout=self.timeout
+                self.BASE_URL, content=_http.dump_json(data), headers=headers, timeout=self.timeout
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as http_err:
+            raise LLMError(f"Fireworks AI request failed: {http_err}")
+        except Exception as e:
+            raise LLMError(f"An error occurred: {e}")
+
+        # Return the normalized response; _http.load_json picks orjson when
+        # available, which is the hot parse on large completion bodies.
+        return self._normalize_response(_http.load_json(response.content))
+
+    async def chat_completions_create_async(self, model, messages,
+                                            tools: typing.Optional[SerializedTools] = None,
+                                            **kwargs):
+        """
+        Async variant of chat_completions_create using the shared pooled
+        AsyncClient, so N concurrent completions overlap on the event loop
+        instead of serializing on network latency.
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+        data = {
+            "model": model,
+            "messages": messages,
+            **kwargs,  # Pass any additional arguments to the API
+        }
+
+        # Add tools to the request if provided
+        if tools:
+            data["tools"] = tools
+
+        try:
+            response = await _http.get_async_client().post(
+                self.BASE_URL, content=_http.dump_json(data), headers=headers, timeout=self.timeout
             )
             response.raise_for_status()
         except httpx.HTTPStatusError as http_err:
@@ -59,14 +98,13 @@ class FireworksChatProvider(ChatProvider):
         except Exception as e:
             raise LLMError(f"An error occurred: {e}")
 
-        # Return the normalized response
-        return self._normalize_response(response.json())
+        return self._normalize_response(_http.load_json(response.content))
 
     def _normalize_response(self, response_data):
         """
         Normalize the response to a common format (ChatCompletionResponse).
         """
-        normalized_response = ChatCompletionResponse()
+        normalized_response = new_single_choice_response()
         response_choice = response_data["choices"][0]
         response_message = response_choice["message"]
         
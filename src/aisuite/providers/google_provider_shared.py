@@ -1,26 +1,28 @@
-import google
-import json
+import itertools
 
-from aisuite.framework import ChatCompletionResponse
-from aisuite.framework.tool_utils import SerializedTools
+from aisuite.framework.chat_completion_response import new_single_choice_response
+
+
+# Role translations shared by both transform passes; bound once at import time.
+_OPENAI_TO_GOOGLE_ROLES = {
+    "system": "user",
+    "assistant": "model",
+}
 
 
 def transform_roles(messages):
     """Transform the roles in the messages based on the provided transformations."""
-    openai_roles_to_google_roles = {
-        "system": "user",
-        "assistant": "model",
-    }
-
+    get_role = _OPENAI_TO_GOOGLE_ROLES.get
     for message in messages:
-        if role := openai_roles_to_google_roles.get(message["role"], None):
+        role = get_role(message["role"])
+        if role is not None:
             message["role"] = role
     return messages
 
 
 def normalize_response(response):
     """Normalize the response from Google AI to match OpenAI's response format."""
-    openai_response = ChatCompletionResponse()
+    openai_response = new_single_choice_response()
     
     # Extract the response content
     if hasattr(response.candidates[0].content.parts[0], 'text'):
@@ -52,32 +54,50 @@ def normalize_response(response):
     return openai_response
 
 
+def _to_google_message(message, role=None):
+    """Build a single Google AI message dict from an OpenAI-style message."""
+    if role is None:
+        role = message["role"]
+    content = message["content"]
+
+    # Create message with basic text content
+    google_message = {'role': role, 'parts': [{'text': content}]}
+
+    # Handle function calls in assistant messages
+    if role == "assistant" and "function_call" in message:
+        google_message['function_call'] = {
+            'name': message["function_call"]["name"],
+            'args': message["function_call"]["arguments"]
+        }
+
+    # Handle function results in function messages
+    if role == "function":
+        google_message['parts'][0]['function_response'] = {
+            'name': message.get("name", ""),
+            'response': content
+        }
+
+    return google_message
+
+
 def convert_openai_to_google_ai(messages):
     """Convert OpenAI messages to Google AI messages using vertex maybe if it talks like a duck. Looks the same"""
-    if len(messages) == 0:
-        return []
+    # List comprehension keeps the hot loop on the CPython LIST_APPEND fast path.
+    return [_to_google_message(message) for message in messages]
 
-    history = []
-    for message in messages:
-        role = message["role"]
-        content = message["content"]
-        
-        # Create message with basic text content
-        google_message = {'role': role, 'parts': [{'text': content}]}
-        
-        # Handle function calls in assistant messages
-        if role == "assistant" and "function_call" in message:
-            google_message['function_call'] = {
-                'name': message["function_call"]["name"],
-                'args': message["function_call"]["arguments"]
-            }
-        
-        # Handle function results in function messages
-        if role == "function":
-            google_message['parts'][0]['function_response'] = {
-                'name': message.get("name", ""),
-                'response': content
-            }
-        
-        history.append(google_message)
-    return history
+
+def messages_to_google(messages, stop=None):
+    """Translate roles and build the Google message history in one pass.
+
+    Fuses transform_roles + convert_openai_to_google_ai so callers walk the
+    messages once, and leaves the caller's message dicts unmutated. ``stop``
+    bounds the pass with islice so callers converting all-but-the-last
+    message avoid an O(n) list slice.
+    """
+    get_role = _OPENAI_TO_GOOGLE_ROLES.get
+    if stop is not None:
+        messages = itertools.islice(messages, stop)
+    return [
+        _to_google_message(message, get_role(message["role"], message["role"]))
+        for message in messages
+    ]
@@ -1,15 +1,26 @@
 """The interface to Google's Vertex AI."""
 import os
 import typing
+from concurrent.futures import ThreadPoolExecutor
 
 import google.generativeai as genai
 from google.generativeai.types import text_types, ToolsType
 from langchain_core.tools import BaseTool
 
-from aisuite.framework.chat_provider import DEFAULT_TEMPERATURE, ChatProvider
+try:
+    import numpy as np
+except ImportError:
+    # numpy is only needed for opt-in embedding quantization.
+    np = None
+
+from aisuite.framework.chat_provider import DEFAULT_TEMPERATURE, AsyncChatProvider
 from aisuite.framework.embedding_provider import EmbeddingProviderInterface, DEFAULT_EMBEDDING_DIM
-from aisuite.framework.tool_utils import SerializedTools
-from aisuite.providers.google_provider_shared import transform_roles, normalize_response, convert_openai_to_google_ai
+from aisuite.framework.tool_utils import (
+    SerializedTools,
+    ToolConversionCache,
+    tool_cache_key,
+)
+from aisuite.providers.google_provider_shared import normalize_response, messages_to_google
 
 
 class GoogleGenAiProvider:
@@ -24,7 +35,15 @@ class GoogleGenAiProvider:
         genai.configure(api_key=api_key)
 
 
-class GooglegenaiChatProvider(GoogleGenAiProvider, ChatProvider):
+class GooglegenaiChatProvider(GoogleGenAiProvider, AsyncChatProvider):
+
+    def __init__(self, **config):
+        super().__init__(**config)
+        # Converted tools payloads keyed by tool content; see AwsChatProvider.
+        self._tool_cache = ToolConversionCache()
+        # GenerativeModel instances keyed by (model, temperature, tools);
+        # construction re-parses the tool declarations, so reuse them.
+        self._model_cache = {}
 
     # TODO: could this return a function with closure containing the chat instead?
     def chat_completions_create(self, model, messages,
@@ -46,55 +65,131 @@ class GooglegenaiChatProvider(GoogleGenAiProvider, ChatProvider):
         # Set the temperature if provided, otherwise use the default
         temperature = kwargs.get("temperature", DEFAULT_TEMPERATURE)
 
-        # Transform the roles in the messages
-        transformed_messages = transform_roles(messages)
-
-        # Convert the messages to the format expected Google
-        final_message_history = convert_openai_to_google_ai(
-            transformed_messages[:-1])
-
-        # Get the last message from the transformed messages
-        last_message = transformed_messages[-1]["content"]
+        # Translate roles and convert to the format expected by Google in a
+        # single pass over the history.
+        final_message_history = messages_to_google(messages, len(messages) - 1)
 
-        tool_call_converted = self.convert_to_tools_types(tools)
+        # Get the last message; only its content is sent.
+        last_message = messages[-1]["content"]
 
-        # Create the GenerativeModel with the specified model and generation configuration
-        model = genai.GenerativeModel(
-            model, generation_config=genai.GenerationConfig(temperature=temperature),
-            tools=tool_call_converted
-        )
+        genai_model = self._get_generative_model(model, temperature, tools)
 
         # Start a chat with the GenerativeModel and send the last message
-        chat = model.start_chat(history=final_message_history)
+        chat = genai_model.start_chat(history=final_message_history)
         response = chat.send_message(last_message)
 
         # Convert the response to the format expected by the OpenAI API
         return normalize_response(response)
 
+    async def chat_completions_create_async(self, model, messages,
+                                            tools: typing.Optional[SerializedTools] = None,
+                                            **kwargs):
+        """Async variant of chat_completions_create using genai's native
+        send_message_async, so concurrent completions overlap on the event
+        loop instead of each blocking a thread.
+        """
+        temperature = kwargs.get("temperature", DEFAULT_TEMPERATURE)
+
+        final_message_history = messages_to_google(messages, len(messages) - 1)
+        last_message = messages[-1]["content"]
+
+        genai_model = self._get_generative_model(model, temperature, tools)
+
+        chat = genai_model.start_chat(history=final_message_history)
+        response = await chat.send_message_async(last_message)
+
+        return normalize_response(response)
+
+    def warmup(self, models: typing.List[str]) -> None:
+        """Force lazy SDK state for each model before the first request."""
+        def _touch(model_name):
+            try:
+                genai.GenerativeModel(model_name).count_tokens("x")
+            except Exception:
+                # Warmup is best-effort; real calls surface errors.
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(4, len(models) or 1)) as executor:
+            list(executor.map(_touch, models))
+
+    def _get_generative_model(self, model, temperature, tools):
+        """Return a cached GenerativeModel for (model, temperature, tools).
+
+        Keyed on the tool content so two distinct-but-equal tools lists share
+        one instance and a recycled object id can never serve a model
+        configured with the wrong tools.
+        """
+        tools_key = tool_cache_key(tools) if tools else None
+        key = (model, temperature, tools_key)
+        genai_model = self._model_cache.get(key)
+        if genai_model is None:
+            genai_model = genai.GenerativeModel(
+                model, generation_config=genai.GenerationConfig(temperature=temperature),
+                tools=self.convert_to_tools_types(tools)
+            )
+            self._model_cache[key] = genai_model
+        return genai_model
+
     def convert_to_tools_types(self, tools) -> typing.Optional[ToolsType]:
         if not tools:
             return None
 
-        tool_types = []
-        for tool in tools:
-            tool_types.append(
-                {
-                    "function_declarations": [
-                        {
-                            "name": tool["name"],
-                            "description": tool["description"],
-                            "parameters": {
-                                "type": "OBJECT",
-                                "properties": tool["args"],
-                            },
-                        }
-                    ]
-                }
-            )
+        tools_key = tool_cache_key(tools)
+        cached = self._tool_cache.get(tools_key)
+        if cached is not None:
+            return cached
+
+        # Pre-sized list filled by index: no append dispatch or list growth,
+        # and the memoization above means this runs once per tools content.
+        tool_types = [None] * len(tools)
+        for i, tool in enumerate(tools):
+            tool_types[i] = {
+                "function_declarations": [
+                    {
+                        "name": tool["name"],
+                        "description": tool["description"],
+                        "parameters": {
+                            "type": "OBJECT",
+                            "properties": tool["args"],
+                        },
+                    }
+                ]
+            }
+        self._tool_cache[tools_key] = tool_types
         return tool_types
 
+# Google's embedding endpoint accepts list inputs; cap sub-batches at the
+# provider maximum and overlap their round-trips.
+EMBED_BATCH_SIZE = 100
+
+
+def _quantize_vector(vec, dtype):
+    """Quantize one fp32 embedding vector to bf16 or scaled int8."""
+    x = np.asarray(vec, dtype=np.float32)
+    if dtype == "bf16":
+        # Keep the high 16 bits of the fp32 pattern.
+        return (x.view(np.uint32) >> 16).astype(np.uint16)
+    # int8: per-vector absmax scale; caller gets (values, scale) to dequantize.
+    scale = float(np.max(np.abs(x))) / 127 if x.size else 1.0
+    if scale == 0.0:
+        scale = 1.0
+    return np.round(x / scale).astype(np.int8), scale
+
+
+def _quantize_embeddings(embeddings, dtype):
+    if embeddings and isinstance(embeddings[0], (list, tuple)):
+        return [_quantize_vector(vec, dtype) for vec in embeddings]
+    return _quantize_vector(embeddings, dtype)
+
+
 class GooglegenaiEmbeddingProvider(GoogleGenAiProvider, EmbeddingProviderInterface):
 
+    def __init__(self, **config):
+        super().__init__(**config)
+        # Embeddings are deterministic per (model, content, dimensionality),
+        # so identical requests can skip the API round-trip entirely.
+        self._embedding_cache = {}
+
     """Defines the expected behavior for provider-specific interfaces."""
     def embedding_create(self, to_embed, model, **kwargs) \
             -> text_types.EmbeddingDict | text_types.BatchEmbeddingDict:
@@ -113,6 +208,78 @@ class GooglegenaiEmbeddingProvider(GoogleGenAiProvider, EmbeddingProviderInterfa
             NotImplementedError: If this method has not been implemented by a subclass.
 
         """
-        return genai.embed_content(model=model, content=to_embed,
-                                   output_dimensionality=kwargs.get("output_dimensionality", DEFAULT_EMBEDDING_DIM))
+        output_dimensionality = kwargs.get("output_dimensionality", DEFAULT_EMBEDDING_DIM)
+        dtype = kwargs.get("dtype", "fp32")
+        if dtype not in ("fp32", "bf16", "int8"):
+            raise ValueError(f"Unsupported embedding dtype: {dtype}")
+        if dtype != "fp32" and np is None:
+            raise ValueError("Embedding quantization requires numpy to be installed.")
+        try:
+            key = (model,
+                   to_embed if isinstance(to_embed, str) else tuple(to_embed),
+                   output_dimensionality,
+                   dtype)
+        except TypeError:
+            # Unhashable content (e.g. nested lists) bypasses the cache.
+            key = None
+
+        if key is not None:
+            cached = self._embedding_cache.get(key)
+            if cached is not None:
+                return cached
+
+        if isinstance(to_embed, (list, tuple)):
+            embedded = self._embed_list(to_embed, model, output_dimensionality)
+        else:
+            embedded = genai.embed_content(model=model, content=to_embed,
+                                           output_dimensionality=output_dimensionality)
+        if dtype != "fp32":
+            # Quantized embeddings cut storage/bandwidth 2-4x while keeping
+            # cosine-similarity accuracy for downstream retrieval.
+            embedded = {"embedding": _quantize_embeddings(embedded["embedding"], dtype)}
+        if key is not None:
+            self._embedding_cache[key] = embedded
+        return embedded
+
+    def _embed_list(self, to_embed, model, output_dimensionality) -> text_types.BatchEmbeddingDict:
+        """Embed a batch, deduplicating inputs and splitting oversized calls.
+
+        Indexing workloads repeat headers and boilerplate; embedding each
+        distinct string once and re-expanding by index cuts billed tokens
+        proportional to the duplicate rate.
+        """
+        try:
+            positions: dict = {}
+            inverse = []
+            for item in to_embed:
+                idx = positions.get(item)
+                if idx is None:
+                    idx = len(positions)
+                    positions[item] = idx
+                inverse.append(idx)
+            unique = list(positions)
+        except TypeError:
+            # Unhashable content; embed as-is.
+            unique, inverse = list(to_embed), None
+
+        if len(unique) > EMBED_BATCH_SIZE:
+            # Split oversized batches and overlap the sub-batch round-trips;
+            # executor.map preserves input order.
+            batches = [unique[i:i + EMBED_BATCH_SIZE]
+                       for i in range(0, len(unique), EMBED_BATCH_SIZE)]
+            embed_batch = lambda batch: genai.embed_content(
+                model=model, content=batch,
+                output_dimensionality=output_dimensionality)
+            embeddings = []
+            with ThreadPoolExecutor(max_workers=min(4, len(batches))) as executor:
+                for result in executor.map(embed_batch, batches):
+                    embeddings.extend(result["embedding"])
+        else:
+            embeddings = genai.embed_content(
+                model=model, content=unique,
+                output_dimensionality=output_dimensionality)["embedding"]
+
+        if inverse is not None and len(unique) < len(inverse):
+            embeddings = [embeddings[i] for i in inverse]
+        return {"embedding": embeddings}
 
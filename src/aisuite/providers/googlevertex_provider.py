@@ -8,7 +8,7 @@ from vertexai.generative_models import GenerativeModel, GenerationConfig
 
 from aisuite.framework import ChatProviderInterface
 from aisuite.framework.tool_utils import SerializedTools
-from aisuite.providers.google_provider_shared import transform_roles, normalize_response, convert_openai_to_google_ai
+from aisuite.providers.google_provider_shared import normalize_response, messages_to_google
 from aisuite.framework.chat_provider import DEFAULT_TEMPERATURE
 
 
@@ -54,16 +54,12 @@ class GooglevertexChatProvider(GoogleProvider):
         # Set the temperature if provided, otherwise use the default
         temperature = kwargs.get("temperature", DEFAULT_TEMPERATURE)
 
-        # Transform the roles in the messages
-        transformed_messages = transform_roles(messages)
+        # Translate roles and convert to the format expected by Google in a
+        # single pass over the history.
+        final_message_history = messages_to_google(messages, len(messages) - 1)
 
-        # Convert the messages to the format expected Google
-        final_message_history = convert_openai_to_google_ai(
-            transformed_messages[:-1]
-        )
-
-        # Get the last message from the transformed messages
-        last_message = transformed_messages[-1]["content"]
+        # Get the last message; only its content is sent.
+        last_message = messages[-1]["content"]
 
         # Create the GenerativeModel with the specified model and generation configuration
         model = GenerativeModel(
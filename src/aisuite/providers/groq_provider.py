@@ -1,13 +1,19 @@
 import os
+import time
 import typing
 
 import groq
 
-from aisuite.framework.chat_provider import ChatProvider
+from aisuite import _http
+from aisuite.framework.chat_provider import AsyncChatProvider
 from aisuite.framework.tool_utils import SerializedTools
+from aisuite.provider import LLMError
 
+# Terminal states for the OpenAI-compatible Batch API.
+_BATCH_DONE = frozenset(("completed", "failed", "cancelled", "expired"))
 
-class GroqChatProvider(ChatProvider):
+
+class GroqChatProvider(AsyncChatProvider):
     def __init__(self, **config):
         """
         Initialize the Groq provider with the given configuration.
@@ -19,11 +25,76 @@ class GroqChatProvider(ChatProvider):
             raise ValueError(
                 " API key is missing. Please provide it in the config or set the GROQ_API_KEY environment variable."
             )
-        self.client = groq.Groq(**config)
+        # Route both clients through the shared pooled httpx clients so
+        # completions reuse keep-alive connections instead of re-handshaking.
+        self.client = groq.Groq(http_client=_http.get_sync_client(), **config)
+        self.async_client = groq.AsyncGroq(http_client=_http.get_async_client(), **config)
+
+    def warmup(self, models: typing.Optional[list] = None) -> None:
+        """Establish the pooled TLS connection before the first completion."""
+        try:
+            self.client.models.list()
+        except Exception:
+            # Warmup is best-effort; the first real call will surface errors.
+            pass
 
     def chat_completions_create(self, model, messages, tools: typing.Optional[SerializedTools]=None, **kwargs):
+        # Responses are returned in groq's native shape, so stream=True simply
+        # passes through and yields the SDK's delta chunks as they arrive.
         return self.client.chat.completions.create(
             model=model,
             messages=messages,
             **kwargs  # Pass any additional arguments to the Groq API
         )
+
+    async def chat_completions_create_async(self, model, messages,
+                                            tools: typing.Optional[SerializedTools] = None,
+                                            **kwargs):
+        """Async variant using groq's native AsyncGroq client."""
+        return await self.async_client.chat.completions.create(
+            model=model,
+            messages=messages,
+            **kwargs
+        )
+
+    def chat_completions_batch(self, model, batch_messages, poll_interval: float = 5.0, **kwargs):
+        """Run many completions through groq's OpenAI-compatible Batch API.
+
+        Meant for bulk/offline workloads (evals, labeling) where the batch
+        endpoint trades latency for cost and throughput: requests are
+        uploaded as one JSONL file, polled until the batch finishes, and the
+        responses are returned in input order. For latency-bound fan-out use
+        chat_completions_create_batch from ChatProvider instead.
+        """
+        lines = [
+            _http.dump_json({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": model, "messages": messages, **kwargs},
+            })
+            for i, messages in enumerate(batch_messages)
+        ]
+        uploaded = self.client.files.create(
+            file=("batch.jsonl", b"\n".join(lines)), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        while batch.status not in _BATCH_DONE:
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            raise LLMError(f"Groq batch {batch.id} finished with status: {batch.status}")
+
+        content = self.client.files.content(batch.output_file_id)
+        text = content.text if hasattr(content, "text") else content.read().decode("utf-8")
+        results = [None] * len(batch_messages)
+        for line in text.splitlines():
+            if not line:
+                continue
+            parsed = _http.load_json(line)
+            results[int(parsed["custom_id"])] = parsed["response"]["body"]
+        return results
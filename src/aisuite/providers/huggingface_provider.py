@@ -2,6 +2,8 @@ import os
 import typing
 
 import httpx
+
+from aisuite import _http
 from aisuite.framework.chat_provider import ChatProvider
 from aisuite.provider import LLMError
 from aisuite.framework import ChatCompletionResponse
@@ -58,7 +60,8 @@ class HuggingfaceChatProvider(ChatProvider):
             raise LLMError(f"An error occurred: {e}")
 
         # Return the normalized response
-        return self._normalize_response(response.json())
+        # _http.load_json picks orjson when available.
+        return self._normalize_response(_http.load_json(response.content))
 
     def _normalize_response(self, response_data):
         """
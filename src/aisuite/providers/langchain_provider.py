@@ -1,17 +1,39 @@
-import json
+import os
 import typing
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
+from langchain.chat_models import ChatOpenAI
 from langchain.schema import HumanMessage, AIMessage, SystemMessage, FunctionMessage
-from langchain.tools import StructuredTool
 from langchain_ollama import ChatOllama, OllamaLLM
 
-from aisuite.framework import ChatCompletionResponse
-from aisuite.framework.chat_provider import ChatProvider, DEFAULT_TEMPERATURE
-from aisuite.framework.tool_utils import SerializedTools
+from aisuite import _http
+from aisuite.framework.chat_completion_response import new_single_choice_response
+from aisuite.framework.chat_provider import AsyncChatProvider, DEFAULT_TEMPERATURE
+from aisuite.framework.tool_utils import (
+    SerializedTools,
+    ToolConversionCache,
+    tool_cache_key,
+)
 from aisuite.provider import LLMError
 
+# Ollama model prefixes mapped to their langchain classes; dispatch strips the
+# prefix with one slice instead of a mismatched replace per call.
+_OLLAMA_PREFIXES = {
+    "ollama_text://": OllamaLLM,
+    "ollama_chat://": ChatOllama,
+}
 
-class LangchainChatProvider(ChatProvider):
+# Role-to-message-class dispatch bound once at import; function messages are
+# handled separately because they also carry a name.
+_ROLE_TO_MESSAGE = {
+    "system": SystemMessage,
+    "user": HumanMessage,
+    "assistant": AIMessage,
+}
+
+
+class LangchainChatProvider(AsyncChatProvider):
     """
     Langchain Provider that supports various LLM backends through the langchain interface.
     This provider implements chat completions through langchain's chat models.
@@ -22,13 +44,36 @@ class LangchainChatProvider(ChatProvider):
         Initialize the provider with the given configuration.
         The token is fetched from the config or environment variables.
         """
+        self.api_key = config.get("api_key") or os.getenv("OPENAI_API_KEY")
         self.base_url = config.get("base_url")
         self.timeout = config.get("timeout", 60)
         self.max_retries = config.get("max_retries", 3)
         
         # Pre-load model if specified in config
         self.default_model = config.get("model")
-        self.model_instances = {}  # Cache for model instances
+        # LRU cache for model instances; each holds HTTP clients and tokenizer
+        # state, so unbounded growth across many model names would leak.
+        self.model_cache_size = config.get("model_cache_size", 32)
+        self.model_instances = OrderedDict()
+        # Converted openai-function payloads keyed by tool content; see
+        # AwsChatProvider.
+        self._tool_cache = ToolConversionCache()
+
+    def warmup(self, models: typing.List[str], **kwargs) -> None:
+        """Construct and cache model instances ahead of the first request.
+
+        Runs in parallel so app startup overlaps the per-model client setup
+        instead of the first user request paying it.
+        """
+        def _resolve(model_name):
+            try:
+                self._prepare_request(model_name, [], None, dict(kwargs))
+            except Exception:
+                # Warmup is best-effort; real calls surface errors.
+                pass
+
+        with ThreadPoolExecutor(max_workers=min(4, len(models) or 1)) as executor:
+            list(executor.map(_resolve, models))
 
     def chat_completions_create(self, model, messages, tools: typing.Optional[SerializedTools] = None, **kwargs):
         """
@@ -43,140 +88,212 @@ class LangchainChatProvider(ChatProvider):
         Returns:
             ChatCompletionResponse: A normalized response object.
         """
+        stream = kwargs.pop("stream", False)
+        chat_model, langchain_messages, request_kwargs = self._prepare_request(
+            model, messages, tools, kwargs)
+
+        if stream:
+            return self._stream_chunks(chat_model, langchain_messages, request_kwargs)
+
+        # Make the request
+        try:
+            response = chat_model.generate([langchain_messages], **request_kwargs)
+            return self._normalize_response(response)
+        except Exception as e:
+            raise LLMError(f"Error in Langchain chat completion: {str(e)}")
+
+    async def chat_completions_create_async(self, model, messages,
+                                            tools: typing.Optional[SerializedTools] = None,
+                                            **kwargs):
+        """
+        Async variant of chat_completions_create using langchain's agenerate,
+        so concurrent completions interleave on the event loop.
+        """
+        chat_model, langchain_messages, request_kwargs = self._prepare_request(
+            model, messages, tools, kwargs)
+
+        try:
+            response = await chat_model.agenerate([langchain_messages], **request_kwargs)
+            return self._normalize_response(response)
+        except Exception as e:
+            raise LLMError(f"Error in Langchain chat completion: {str(e)}")
+
+    @staticmethod
+    def _stream_chunks(chat_model, langchain_messages, request_kwargs):
+        """Yield OpenAI-style delta chunks from langchain's streaming API.
+
+        Each chunk is normalized on its own rather than re-normalizing the
+        accumulated response, so time-to-first-token tracks the backend.
+        """
+        try:
+            for chunk in chat_model.stream(langchain_messages, **request_kwargs):
+                yield {
+                    "choices": [{
+                        "index": 0,
+                        "delta": {"content": getattr(chunk, "content", chunk)},
+                        "finish_reason": None,
+                    }]
+                }
+            yield {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+        except Exception as e:
+            raise LLMError(f"Error in Langchain chat completion: {str(e)}")
+
+    def _prepare_request(self, model, messages, tools, kwargs):
+        """Resolve the chat model, langchain messages, and per-call kwargs."""
         # Set temperature if provided, otherwise use default
         temperature = kwargs.get("temperature", DEFAULT_TEMPERATURE)
-        
+
         # Use provided model or default model from config
         model_name = model or self.default_model
         if not model_name:
             raise LLMError("No model specified for Langchain provider")
 
-        # Get or create the model instance
-        if model_name not in self.model_instances:
-            if model.startswith('ollama_text://'):
-                chat_model = OllamaLLM(model = model_name.replace("ollama_text://ollama_text/", ""))
-            if model.startswith('ollama_chat://'):
-                chat_model = ChatOllama(model = model_name.replace("ollama_chat://ollama_chat/", ""))
+        # Get or create the model instance; reusing the cached model avoids
+        # re-opening HTTP sessions per call. Keyed by (model, temperature) so
+        # distinct temperatures get distinct instances instead of mutating a
+        # cached model shared across concurrent callers.
+        cache_key = (model_name, temperature)
+        chat_model = self.model_instances.get(cache_key)
+        if chat_model is not None:
+            self.model_instances.move_to_end(cache_key)
+        else:
+            for prefix, ollama_cls in _OLLAMA_PREFIXES.items():
+                if model_name.startswith(prefix):
+                    chat_model = ollama_cls(model=model_name[len(prefix):],
+                                            temperature=temperature)
+                    break
             else:
-                raise ValueError(f"Could not retrieve chat model for {chat_model}")
+                chat_model = ChatOpenAI(
+                    model_name=model_name,
+                    openai_api_key=self.api_key,
+                    openai_api_base=self.base_url,
+                    request_timeout=self.timeout,
+                    max_retries=self.max_retries,
+                    temperature=temperature,
+                )
 
-            self.model_instances[model_name] = chat_model
-        else:
-            chat_model = self.model_instances[model_name]
-            # Update temperature if different from cached instance
-            # if chat_model.temperature != temperature:
-            #     chat_model.temperature = temperature
+            self.model_instances[cache_key] = chat_model
+            while len(self.model_instances) > self.model_cache_size:
+                _, evicted = self.model_instances.popitem(last=False)
+                _close_model_clients(evicted)
         
-        # Convert messages to Langchain's format
+        # Convert messages to Langchain's format; a dict dispatch replaces the
+        # per-message if/elif chain.
         langchain_messages = []
+        append = langchain_messages.append
         for message in messages:
             role = message.get("role", "").lower()
-            content = message.get("content", "")
-            
-            if role == "system":
-                langchain_messages.append(SystemMessage(content=content))
-            elif role == "user":
-                langchain_messages.append(HumanMessage(content=content))
-            elif role == "assistant":
-                langchain_messages.append(AIMessage(content=content))
-
-        # Handle tools if provided
+            message_cls = _ROLE_TO_MESSAGE.get(role)
+            if message_cls is not None:
+                append(message_cls(content=message.get("content", "")))
+            elif role == "function":
+                append(FunctionMessage(name=message.get("name", ""),
+                                       content=message.get("content", "")))
+
+        # Handle tools if provided; the chat model is a shared cached
+        # instance, so the functions travel as per-call kwargs rather than
+        # being set on it.
+        request_kwargs = {}
         if tools:
-            langchain_tools = []
-            for tool in tools:
-                # Create a more structured tool definition
-                tool_func = lambda **kwargs: json.dumps(kwargs)  # Placeholder function
-                
-                # Extract parameters schema from the tool definition
-                parameters_schema = {}
-                if "args" in tool:
-                    parameters_schema = {
-                        "type": "object",
-                        "properties": tool["args"],
-                        "required": [k for k, v in tool["args"].items() if v.get("required", False)]
+            tools_key = tool_cache_key(tools)
+            openai_functions = self._tool_cache.get(tools_key)
+            if openai_functions is None:
+                # The serialized tools already carry name/description/args;
+                # build the OpenAI function payloads directly instead of
+                # round-tripping through StructuredTool.
+                openai_functions = []
+                for tool in tools:
+                    function = {
+                        "name": tool["name"],
+                        "description": tool["description"],
                     }
-                
-                structured_tool = StructuredTool(
-                    name=tool["name"],
-                    description=tool["description"],
-                    func=tool_func,
-                    args_schema=parameters_schema
-                )
-                langchain_tools.append(structured_tool)
-            
-            # Set the functions on the model
-            chat_model.functions = [t.to_openai_function() for t in langchain_tools]
-        
-        # Make the request
-        try:
-            response = chat_model.generate([langchain_messages])
-            return self._normalize_response(response)
-        except Exception as e:
-            raise LLMError(f"Error in Langchain chat completion: {str(e)}")
+                    if "args" in tool:
+                        function["parameters"] = {
+                            "type": "object",
+                            "properties": tool["args"],
+                            "required": [k for k, v in tool["args"].items() if v.get("required", False)]
+                        }
+                    openai_functions.append(function)
+                self._tool_cache[tools_key] = openai_functions
+            request_kwargs["functions"] = openai_functions
+
+        return chat_model, langchain_messages, request_kwargs
 
     def _normalize_response(self, response_data):
         """
         Normalize the response to a common format (ChatCompletionResponse).
-        
+
         Args:
             response_data: The raw response from Langchain.
-            
+
         Returns:
             ChatCompletionResponse: A normalized response object.
         """
-        try:
-            # Extract the generation from the response
-            generation = response_data.generations[0][0]
-            message = generation.message
-            
-            # Initialize response components
-            function_call = None
-            tool_calls = None
-            
-            # Check for function call or tool calls in additional kwargs
-            if hasattr(message, "additional_kwargs"):
-                additional_kwargs = message.additional_kwargs
-                
-                # Handle function_call (legacy format)
-                if "function_call" in additional_kwargs:
-                    function_call = additional_kwargs["function_call"]
-                
-                # Handle tool_calls (newer format)
-                if "tool_calls" in additional_kwargs:
-                    tool_calls = additional_kwargs["tool_calls"]
-            
-            # Build the message component
-            assistant_message = {
-                "role": "assistant",
-                "content": message.content,
-            }
-            
-            # Add function_call or tool_calls if present
-            if function_call:
-                assistant_message["function_call"] = function_call
-            if tool_calls:
-                assistant_message["tool_calls"] = tool_calls
-            
-            # Create a normalized response
-            normalized_response = ChatCompletionResponse(
-                id=response_data.llm_output.get("id", ""),
-                object="chat.completion",
-                created=response_data.llm_output.get("created", 0),
-                model=response_data.llm_output.get("model", ""),
-                choices=[
-                    {
-                        "index": 0,
-                        "message": assistant_message,
-                        "finish_reason": generation.finish_reason or "stop"
-                    }
-                ],
-                usage=response_data.llm_output.get("usage", {
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "total_tokens": 0
-                })
-            )
-            
-            return normalized_response
-        except Exception as e:
-            raise LLMError(f"Error normalizing Langchain response: {str(e)}")
+        return _normalize_langchain_response(response_data)
+
+
+def _close_model_clients(model):
+    """Best-effort close of HTTP clients held by an evicted model instance."""
+    for attr in ("client", "async_client", "http_client"):
+        close = getattr(getattr(model, attr, None), "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                pass
+
+
+# Pre-bound default so the miss path doesn't allocate a dict literal per call.
+_DEFAULT_USAGE = {
+    "prompt_tokens": 0,
+    "completion_tokens": 0,
+    "total_tokens": 0,
+}
+
+
+def _normalize_langchain_response(response_data):
+    """Normalize a langchain LLMResult into a ChatCompletionResponse.
+
+    Module-level so both the sync and async completion paths share one
+    implementation and the hot attribute lookups stay in one place.
+    """
+    try:
+        # Extract the generation from the response
+        generation = response_data.generations[0][0]
+        message = generation.message
+
+        # getattr with a default skips hasattr's internal exception handling
+        # on the miss path and flattens the control flow.
+        additional_kwargs = getattr(message, "additional_kwargs", None) or {}
+        function_call = additional_kwargs.get("function_call")
+        tool_calls = additional_kwargs.get("tool_calls")
+
+        normalized_response = new_single_choice_response()
+        choice = normalized_response.choices[0]
+        choice.index = 0
+        # Langchain carries finish_reason inside generation_info; a bare
+        # attribute is still honored for callers that set one directly.
+        finish_reason = getattr(generation, "finish_reason", None)
+        if finish_reason is None:
+            generation_info = getattr(generation, "generation_info", None)
+            if generation_info:
+                finish_reason = generation_info.get("finish_reason")
+        choice.finish_reason = finish_reason or "stop"
+        choice.message.role = "assistant"
+        choice.message.content = message.content
+        if function_call:
+            choice.message.function_call = function_call
+        if tool_calls:
+            choice.message.tool_calls = tool_calls
+
+        # One local for llm_output halves the attribute lookups below.
+        llm_output = response_data.llm_output or {}
+        normalized_response.id = llm_output.get("id", "")
+        normalized_response.object = "chat.completion"
+        normalized_response.created = llm_output.get("created", 0)
+        normalized_response.model = llm_output.get("model", "")
+        normalized_response.usage = llm_output.get("usage", _DEFAULT_USAGE)
+
+        return normalized_response
+    except Exception as e:
+        raise LLMError(f"Error normalizing Langchain response: {str(e)}")
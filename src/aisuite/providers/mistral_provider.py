@@ -3,11 +3,12 @@ import typing
 
 from mistralai import Mistral
 
-from aisuite.framework.chat_provider import ChatProvider
+from aisuite import _http
+from aisuite.framework.chat_provider import AsyncChatProvider
 from aisuite.framework.tool_utils import SerializedTools
 
 
-class MistralChatProvider(ChatProvider):
+class MistralChatProvider(AsyncChatProvider):
     def __init__(self, **config):
         """
         Initialize the Mistral provider with the given configuration.
@@ -19,7 +20,13 @@ class MistralChatProvider(ChatProvider):
             raise ValueError(
                 "API key is missing. Please provide it in the config or set the MISTRAL_API_KEY environment variable."
             )
+        # Reuse the shared pooled HTTP client so keep-alive sockets survive across instances.
+        config.setdefault("client", _http.get_sync_client())
         self.client = Mistral(**config)
 
     def chat_completions_create(self, model, messages, tools: typing.Optional[SerializedTools]=None, **kwargs):
         return self.client.chat.complete(model=model, messages=messages, **kwargs)
+
+    async def chat_completions_create_async(self, model, messages, tools: typing.Optional[SerializedTools]=None, **kwargs):
+        # mistralai ships a native async client; no executor hop needed.
+        return await self.client.chat.complete_async(model=model, messages=messages, **kwargs)
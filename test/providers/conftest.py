@@ -0,0 +1,99 @@
+import socket
+
+import httpx
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_real_http():
+    """Fail fast on any un-mocked network call.
+
+    A test that forgets to stub its HTTP layer would otherwise block on real
+    DNS/TCP to a provider endpoint for seconds (or minutes on CI timeouts).
+    Raising at the socket layer turns that into an immediate, attributable
+    failure; mocked transports never open a connection, so they are unaffected.
+    """
+    mp = pytest.MonkeyPatch()
+
+    def _blocked_connect(self, address):
+        raise RuntimeError(f"real network disabled in tests (connect to {address!r})")
+
+    mp.setattr(socket.socket, "connect", _blocked_connect)
+    yield
+    mp.undo()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def provider_env_vars():
+    """Set provider credentials once per session instead of once per test.
+
+    The per-module function-scoped fixtures re-applied the same values before
+    every test; a single session-scoped MonkeyPatch amortizes the setup across
+    all provider modules. Tests that need a variable absent remove it inside
+    their own MonkeyPatch.context() so the session state is restored.
+    """
+    mp = pytest.MonkeyPatch()
+    for key, value in (
+        ("AZURE_API_KEY", "test-api-key"),
+        ("AZURE_BASE_URL", "test-deployment.westus3.models.ai.azure.com"),
+        ("FIREWORKS_API_KEY", "test-api-key"),
+        ("OPENAI_API_KEY", "test-api-key"),
+    ):
+        mp.setenv(key, value)
+    yield
+    mp.undo()
+
+
+class TransportRecorder:
+    """State shared between a test and the session MockTransport handler."""
+
+    def __init__(self):
+        self.requests = []
+        self.payload = {}
+        self.status_code = 200
+        self.error = None
+
+    def handler(self, request):
+        self.requests.append(request)
+        if self.error is not None:
+            raise self.error
+        return httpx.Response(self.status_code, json=self.payload)
+
+
+# The active recorder for the current test; the session client's handler
+# routes through it so the client itself never has to be rebuilt.
+_transport_router = {"recorder": None}
+
+
+@pytest.fixture(scope="session")
+def mocked_httpx_client():
+    """One httpx.Client over a MockTransport for the whole session.
+
+    Client construction allocates connection pools and SSL context state;
+    building it once and swapping the active recorder per test keeps that
+    cost out of every test.
+    """
+    def _handler(request):
+        recorder = _transport_router["recorder"]
+        if recorder is None:
+            raise RuntimeError("no transport recorder installed for this test")
+        return recorder.handler(request)
+
+    client = httpx.Client(transport=httpx.MockTransport(_handler))
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def httpx_transport(mocked_httpx_client, monkeypatch):
+    """Route httpx.post through the session MockTransport client.
+
+    The handler returns a real httpx.Response — no MagicMock construction or
+    attribute autospec per test — and records each request so tests can
+    assert on the serialized body.
+    """
+    recorder = TransportRecorder()
+    _transport_router["recorder"] = recorder
+    monkeypatch.setattr(httpx, "post", mocked_httpx_client.post)
+    yield recorder
+    _transport_router["recorder"] = None
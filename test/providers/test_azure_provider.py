@@ -1,17 +1,108 @@
-from unittest.mock import MagicMock, patch
 import json
+import types
+
 import pytest
-import urllib.request
-from urllib.error import HTTPError
 
 from aisuite.providers.azure_provider import AzureChatProvider
 
+# Mock payloads built once at import; the tests only read them, so sharing
+# one dict per shape avoids reallocating the same nested literals per test.
+_AZURE_BASIC_RESPONSE = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion",
+    "created": 1677858242,
+    "model": "gpt-4",
+    "choices": [
+        {
+            "message": {
+                "role": "assistant",
+                "content": "Hello! How can I help you today?"
+            },
+            "finish_reason": "stop",
+            "index": 0
+        }
+    ],
+    "usage": {
+        "prompt_tokens": 13,
+        "completion_tokens": 7,
+        "total_tokens": 20
+    }
+}
+
+_AZURE_TOOL_RESPONSE = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion",
+    "created": 1677858242,
+    "model": "gpt-4",
+    "choices": [
+        {
+            "message": {
+                "role": "assistant",
+                "content": "I'll check the weather for you.",
+                "tool_calls": [
+                    {
+                        "id": "call_abc123",
+                        "type": "function",
+                        "function": {
+                            "name": "get_weather",
+                            "arguments": '{"location": "New York"}'
+                        }
+                    }
+                ]
+            },
+            "finish_reason": "tool_calls",
+            "index": 0
+        }
+    ],
+    "usage": {
+        "prompt_tokens": 20,
+        "completion_tokens": 15,
+        "total_tokens": 35
+    }
+}
+
+_AZURE_FUNCTION_RESPONSE = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion",
+    "created": 1677858242,
+    "model": "gpt-4",
+    "choices": [
+        {
+            "message": {
+                "role": "assistant",
+                "content": "I'll search for information about climate change.",
+                "function_call": {
+                    "name": "search",
+                    "arguments": '{"query": "climate change impact"}'
+                }
+            },
+            "finish_reason": "function_call",
+            "index": 0
+        }
+    ]
+}
+
+# The error stub carries no per-test state, so it is built once here rather
+# than inside the error test.
+_AZURE_401_RESPONSE = types.SimpleNamespace(status_code=401, headers={}, text="Unauthorized")
+
+_WEATHER_TOOLS = [
+    {
+        "name": "get_weather",
+        "description": "Get the current weather in a location",
+        "args": {
+            "location": {"type": "string", "description": "The city and state, e.g. San Francisco, CA"}
+        }
+    }
+]
+
 
-@pytest.fixture(autouse=True)
-def set_azure_env_vars(monkeypatch):
-    """Fixture to set environment variables for Azure tests."""
-    monkeypatch.setenv("AZURE_API_KEY", "test-api-key")
-    monkeypatch.setenv("AZURE_BASE_URL", "test-deployment.westus3.models.ai.azure.com")
+@pytest.fixture(scope="module")
+def azure_provider():
+    """One provider shared across the module; __init__ only reads config/env,
+    so re-running it per test bought nothing. The init test below constructs
+    its own instances to exercise the init paths."""
+    return AzureChatProvider()
 
 
 def test_azure_provider_init():
@@ -20,7 +111,7 @@ def test_azure_provider_init():
     provider = AzureChatProvider()
     assert provider.api_key == "test-api-key"
     assert provider.base_url == "test-deployment.westus3.models.ai.azure.com"
-    
+
     # Test with explicit config
     provider = AzureChatProvider(
         api_key="explicit-api-key",
@@ -28,208 +119,100 @@ def test_azure_provider_init():
     )
     assert provider.api_key == "explicit-api-key"
     assert provider.base_url == "custom-deployment.eastus.models.ai.azure.com"
-    
-    # Test missing API key
-    with pytest.raises(ValueError, match="api_key is required"):
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.delenv("AZURE_API_KEY", raising=False)
+
+    # Test missing API key; the context undoes the delenv so the
+    # session-scoped env vars stay intact for later tests.
+    with pytest.raises(ValueError, match="api_key is required"), \
+            pytest.MonkeyPatch.context() as mp:
+        mp.delenv("AZURE_API_KEY", raising=False)
         AzureChatProvider(base_url="test.com")
-    
+
     # Test missing base URL
-    with pytest.raises(ValueError, match="base_url is required"):
-        monkeypatch = pytest.MonkeyPatch()
-        monkeypatch.delenv("AZURE_BASE_URL", raising=False)
+    with pytest.raises(ValueError, match="base_url is required"), \
+            pytest.MonkeyPatch.context() as mp:
+        mp.delenv("AZURE_BASE_URL", raising=False)
         AzureChatProvider(api_key="test-key")
 
 
-class MockResponse:
-    """Mock class for urllib.request.urlopen response."""
-    
-    def __init__(self, json_data, status=200):
-        self.json_data = json_data
-        self.status = status
-    
-    def read(self):
-        return json.dumps(self.json_data).encode('utf-8')
-    
-    def __enter__(self):
-        return self
-    
-    def __exit__(self, *args):
-        pass
-
-
-def test_azure_chat_completions_basic():
-    """Test basic chat completions without tools."""
-    provider = AzureChatProvider()
-    
-    # Mock response for a basic chat completion
-    mock_response = {
-        "id": "chatcmpl-123",
-        "object": "chat.completion",
-        "created": 1677858242,
-        "model": "gpt-4",
-        "choices": [
-            {
-                "message": {
-                    "role": "assistant",
-                    "content": "Hello! How can I help you today?"
-                },
-                "finish_reason": "stop",
-                "index": 0
-            }
-        ],
-        "usage": {
-            "prompt_tokens": 13,
-            "completion_tokens": 7,
-            "total_tokens": 20
-        }
-    }
-    
-    with patch('urllib.request.urlopen', return_value=MockResponse(mock_response)):
-        with patch('urllib.request.Request', return_value=MagicMock()):
-            response = provider.chat_completions_create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": "Hello!"}],
-                temperature=0.7
-            )
-    
-    # Verify the response was normalized correctly
-    assert response.choices[0].message.content == "Hello! How can I help you today!"
+def make_response(json_data, status=200):
+    """Build a plain stub for the pooled client's response.
 
+    A SimpleNamespace is much cheaper to construct than a MagicMock, whose
+    lazy child-attribute machinery the provider never uses.
+    """
+    return types.SimpleNamespace(
+        status_code=status, content=json.dumps(json_data).encode("utf-8"))
 
-def test_azure_chat_completions_with_tools():
-    """Test chat completions with tools."""
-    provider = AzureChatProvider()
-    
-    # Define tools
-    tools = [
-        {
-            "name": "get_weather", 
-            "description": "Get the current weather in a location",
-            "args": {
-                "location": {"type": "string", "description": "The city and state, e.g. San Francisco, CA"}
-            }
-        }
-    ]
-    
-    # Mock response with tool calls
-    mock_response = {
-        "id": "chatcmpl-123",
-        "object": "chat.completion",
-        "created": 1677858242,
-        "model": "gpt-4",
-        "choices": [
-            {
-                "message": {
-                    "role": "assistant",
-                    "content": "I'll check the weather for you.",
-                    "tool_calls": [
-                        {
-                            "id": "call_abc123",
-                            "type": "function",
-                            "function": {
-                                "name": "get_weather",
-                                "arguments": json.dumps({"location": "New York"})
-                            }
-                        }
-                    ]
-                },
-                "finish_reason": "tool_calls",
-                "index": 0
-            }
-        ],
-        "usage": {
-            "prompt_tokens": 20,
-            "completion_tokens": 15,
-            "total_tokens": 35
-        }
-    }
-    
-    # Mock the request
-    with patch('urllib.request.urlopen', return_value=MockResponse(mock_response)):
-        with patch('urllib.request.Request') as mock_request:
-            response = provider.chat_completions_create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": "What's the weather in New York?"}],
-                tools=tools
-            )
-            
-            # Verify tools were included in the request
-            request_args = mock_request.call_args
-            request_body = json.loads(request_args[0][1].decode('utf-8'))
-            assert "tools" in request_body
-            assert request_body["tools"] == tools
-    
-    # Verify the response was normalized correctly
-    assert response.choices[0].message.content == "I'll check the weather for you."
-    assert response.choices[0].message.tool_calls is not None
-    assert len(response.choices[0].message.tool_calls) == 1
-    assert response.choices[0].message.tool_calls[0]["function"]["name"] == "get_weather"
-    assert json.loads(response.choices[0].message.tool_calls[0]["function"]["arguments"])["location"] == "New York"
-    assert response.choices[0].finish_reason == "tool_calls"
 
+# The basic/tools/function-call tests all exercised the same
+# create-and-normalize path with a different payload; one parametrized test
+# shares the provider fixture and stubbing across the three cases.
+@pytest.mark.parametrize("payload, tools, expected_content, expected_finish", [
+    pytest.param(_AZURE_BASIC_RESPONSE, None,
+                 "Hello! How can I help you today?", None, id="basic"),
+    pytest.param(_AZURE_TOOL_RESPONSE, _WEATHER_TOOLS,
+                 "I'll check the weather for you.", "tool_calls", id="tools"),
+    pytest.param(_AZURE_FUNCTION_RESPONSE, None,
+                 "I'll search for information about climate change.",
+                 "function_call", id="function-call"),
+])
+def test_azure_chat_completions(azure_provider, monkeypatch,
+                                payload, tools, expected_content, expected_finish):
+    """Test chat completions across the basic/tools/function-call shapes."""
+    provider = azure_provider
+
+    # Stub the request, capturing the serialized body through a closure. The
+    # response is built (and its body serialized) once, not per post call.
+    captured = {}
+    stub_response = make_response(payload)
+
+    def fake_post(url, **kwargs):
+        captured["content"] = kwargs["content"]
+        return stub_response
+
+    monkeypatch.setattr(provider._client, "post", fake_post)
+    response = provider.chat_completions_create(
+        model="gpt-4",
+        messages=[{"role": "user", "content": "Hello!"}],
+        **({"tools": tools} if tools else {"temperature": 0.7})
+    )
 
-def test_azure_chat_completions_with_function_call():
-    """Test chat completions with function calls (legacy format)."""
-    provider = AzureChatProvider()
-    
-    # Mock response with function call
-    mock_response = {
-        "id": "chatcmpl-123",
-        "object": "chat.completion",
-        "created": 1677858242,
-        "model": "gpt-4",
-        "choices": [
-            {
-                "message": {
-                    "role": "assistant",
-                    "content": "I'll search for information about climate change.",
-                    "function_call": {
-                        "name": "search",
-                        "arguments": json.dumps({"query": "climate change impact"})
-                    }
-                },
-                "finish_reason": "function_call",
-                "index": 0
-            }
-        ]
-    }
-    
-    with patch('urllib.request.urlopen', return_value=MockResponse(mock_response)):
-        with patch('urllib.request.Request', return_value=MagicMock()):
-            response = provider.chat_completions_create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": "Tell me about climate change"}]
-            )
-    
     # Verify the response was normalized correctly
-    assert response.choices[0].message.content == "I'll search for information about climate change."
-    assert response.choices[0].message.function_call is not None
-    assert response.choices[0].message.function_call["name"] == "search"
-    assert json.loads(response.choices[0].message.function_call["arguments"])["query"] == "climate change impact"
-    assert response.choices[0].finish_reason == "function_call"
+    choice = response.choices[0]
+    assert choice.message.content == expected_content
+
+    if tools:
+        # Verify tools were included in the request
+        request_body = json.loads(captured["content"])
+        assert "tools" in request_body
+        assert request_body["tools"] == tools
 
+    if expected_finish == "tool_calls":
+        assert choice.message.tool_calls is not None
+        assert len(choice.message.tool_calls) == 1
+        assert choice.message.tool_calls[0]["function"]["name"] == "get_weather"
+        # The mock authored this exact string; compare it directly instead of
+        # re-parsing JSON both sides wrote.
+        assert choice.message.tool_calls[0]["function"]["arguments"] == '{"location": "New York"}'
+        assert choice.finish_reason == "tool_calls"
+    elif expected_finish == "function_call":
+        assert choice.message.function_call is not None
+        assert choice.message.function_call["name"] == "search"
+        assert choice.message.function_call["arguments"] == '{"query": "climate change impact"}'
+        assert choice.finish_reason == "function_call"
 
-def test_azure_error_handling():
+
+def test_azure_error_handling(azure_provider, monkeypatch):
     """Test error handling in the Azure provider."""
-    provider = AzureChatProvider()
-    
-    # Mock an HTTP error
-    http_error = HTTPError(
-        url="https://test-deployment.westus3.models.ai.azure.com/chat/completions",
-        code=401,
-        msg="Unauthorized",
-        hdrs={},
-        fp=None
-    )
-    
-    with patch('urllib.request.urlopen', side_effect=http_error):
-        with patch('urllib.request.Request', return_value=MagicMock()):
-            with pytest.raises(Exception) as excinfo:
-                provider.chat_completions_create(
-                    model="gpt-4",
-                    messages=[{"role": "user", "content": "Hello"}]
-                )
-            
-            assert "The request failed with status code: 401" in str(excinfo.value)
\ No newline at end of file
+    provider = azure_provider
+
+    # Stub an HTTP error response from the endpoint
+    monkeypatch.setattr(provider._client, "post",
+                        lambda *args, **kwargs: _AZURE_401_RESPONSE)
+    with pytest.raises(Exception) as excinfo:
+        provider.chat_completions_create(
+            model="gpt-4",
+            messages=[{"role": "user", "content": "Hello"}]
+        )
+
+    assert "The request failed with status code: 401" in str(excinfo.value)
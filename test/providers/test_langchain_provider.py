@@ -1,23 +1,166 @@
-from unittest.mock import MagicMock, patch
+import functools
+from contextlib import contextmanager, nullcontext
+from types import SimpleNamespace
 
 import pytest
-import json
-from langchain.chat_models import ChatOpenAI
-from langchain.schema import LLMResult, Generation, ChatGeneration, AIMessage
-from langchain.schema.messages import HumanMessage, SystemMessage
 
-from aisuite.providers.langchain_provider import LangchainChatProvider
 from aisuite.provider import LLMError
 
 
-@pytest.fixture(autouse=True)
-def set_api_key_env_var(monkeypatch):
-    """Fixture to set environment variables for tests."""
-    monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+@functools.lru_cache(maxsize=1)
+def _lc():
+    """Import the langchain-facing names once, on first use.
+
+    Importing langchain (and the provider module, which pulls it in) at
+    module top would run the whole pydantic/openai import graph during
+    collection on every xdist worker; deferring it means only the worker
+    that actually runs this module pays for it.
+    """
+    from langchain.chat_models import ChatOpenAI
+    from langchain.schema import LLMResult, ChatGeneration, AIMessage
+    from langchain.schema.messages import HumanMessage, SystemMessage
+
+    from aisuite.providers.langchain_provider import LangchainChatProvider
+
+    return SimpleNamespace(
+        ChatOpenAI=ChatOpenAI,
+        AIMessage=AIMessage,
+        ChatGeneration=ChatGeneration,
+        LLMResult=LLMResult,
+        HumanMessage=HumanMessage,
+        SystemMessage=SystemMessage,
+        LangchainChatProvider=LangchainChatProvider,
+    )
+
+
+# Tool/function argument payloads authored once; the assertions compare
+# against the same constants, so nothing parses JSON at test time.
+_WEATHER_ARGS = '{"location": "New York"}'
+_FLIGHT_ARGS = '{"destination": "New York", "date": "2023-12-15"}'
+_HOTEL_ARGS = '{"city": "New York", "check_in": "2023-12-15", "nights": 3}'
+
+_WEATHER_TOOLS = [
+    {
+        "name": "get_weather",
+        "description": "Get the current weather in a location",
+        "args": {
+            "location": {"type": "string", "description": "The city and state, e.g. San Francisco, CA"}
+        }
+    }
+]
+
+_BOOKING_TOOLS = [
+    {
+        "name": "book_flight",
+        "description": "Book a flight to a destination",
+        "args": {
+            "destination": {"type": "string", "description": "City name"},
+            "date": {"type": "string", "description": "Date in YYYY-MM-DD format"}
+        }
+    },
+    {
+        "name": "book_hotel",
+        "description": "Book a hotel in a city",
+        "args": {
+            "city": {"type": "string", "description": "City name"},
+            "check_in": {"type": "string", "description": "Check-in date"},
+            "nights": {"type": "integer", "description": "Number of nights"}
+        }
+    }
+]
+
+def _make_result(content, additional_kwargs=None, finish_reason="stop", llm_output=None):
+    """Build real langchain result objects without validator passes.
+
+    model_construct skips pydantic's type coercion and required-field
+    checks, which are nontrivial on the nested generations list, while the
+    objects remain genuine AIMessage/ChatGeneration/LLMResult instances.
+    """
+    lc = _lc()
+    message = lc.AIMessage.model_construct(
+        content=content,
+        additional_kwargs=additional_kwargs or {},
+        response_metadata={},
+        type="ai",
+    )
+    generation = lc.ChatGeneration.model_construct(
+        message=message,
+        text=content,
+        generation_info={"finish_reason": finish_reason},
+        type="ChatGeneration",
+    )
+    return lc.LLMResult.model_construct(
+        generations=[[generation]],
+        llm_output=llm_output or {},
+        run=None,
+    )
+
+
+def _make_ns_result(content, additional_kwargs=None, finish_reason="stop", llm_output=None):
+    """Duck-typed stand-in for LLMResult built from SimpleNamespaces.
+
+    The normalizer only attribute-reads generations[0][0], its message, and
+    llm_output, so namespaces serve the non-contract tests at near-zero
+    construction cost; one test keeps real pydantic objects to guard the
+    contract.
+    """
+    message = SimpleNamespace(
+        content=content, additional_kwargs=additional_kwargs or {}, type="ai")
+    generation = SimpleNamespace(
+        message=message,
+        generation_info={"finish_reason": finish_reason},
+        text=content)
+    return SimpleNamespace(generations=[[generation]], llm_output=llm_output or {})
+
+
+class _Recorder:
+    """Minimal callable stub: records calls, returns ret or raises exc.
+
+    MagicMock's child-attribute and call-tracking machinery is overkill for
+    stubbing generate; a slotted recorder keeps the per-test allocation
+    trivial and the assertions are plain list reads.
+    """
+    __slots__ = ("calls", "ret", "exc")
+
+    def __init__(self, ret=None, exc=None):
+        self.calls = []
+        self.ret = ret
+        self.exc = exc
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.exc is not None:
+            raise self.exc
+        return self.ret
+
+
+@contextmanager
+def _swap(target, attr, new):
+    """Swap an attribute for the duration of the block.
+
+    unittest.mock's _patch machinery walks frames and rebuilds patcher state
+    on every __enter__/__exit__; a bare setattr/restore does the same job for
+    these tests at a fraction of the cost.
+    """
+    old = getattr(target, attr)
+    setattr(target, attr, new)
+    try:
+        yield new
+    finally:
+        setattr(target, attr, old)
+
+
+@pytest.fixture(scope="module")
+def provider():
+    """One provider shared across the module; the API key is captured at
+    construction from the session env fixture and never varies here."""
+    return _lc().LangchainChatProvider()
 
 
 def test_langchain_provider_init():
     """Test that the provider is initialized correctly."""
+    LangchainChatProvider = _lc().LangchainChatProvider
+
     # Test with API key from environment
     provider = LangchainChatProvider()
     assert provider.api_key == "test-api-key"
@@ -41,125 +184,34 @@ def test_langchain_provider_init():
     assert provider.default_model == "gpt-4"
 
 
-def test_chat_completions_create_basic():
-    """Test basic chat completions without tools."""
-    user_greeting = "Hello!"
-    message_history = [{"role": "user", "content": user_greeting}]
-    selected_model = "gpt-3.5-turbo"
-    chosen_temperature = 0.75
-    response_text_content = "Hello! How can I help you today?"
-
-    # Create mock AIMessage with content
-    ai_message = AIMessage(content=response_text_content)
-    
-    # Create mock generation
-    mock_generation = ChatGeneration(message=ai_message)
-    mock_generation.finish_reason = "stop"
-    
-    # Create mock LLMResult
-    mock_llm_result = LLMResult(
-        generations=[[mock_generation]],
-        llm_output={"id": "test-id", "created": 1234567890, "model": selected_model}
-    )
-
-    provider = LangchainChatProvider()
-    
-    # Mock the ChatOpenAI.generate method
-    with patch.object(
-        ChatOpenAI,
-        'generate',
-        return_value=mock_llm_result
-    ) as mock_generate:
-        response = provider.chat_completions_create(
-            messages=message_history,
-            model=selected_model,
-            temperature=chosen_temperature,
-        )
-
-        # Check that generate was called with the right messages
-        mock_generate.assert_called_once()
-        
-        # Check response content
-        assert response.choices[0].message.content == response_text_content
-        assert response.model == selected_model
-        assert response.choices[0].finish_reason == "stop"
-
+# Canned results for the parametrized success cases, built once at import.
+_BASIC_RESULT = _make_ns_result(
+    "Hello! How can I help you today?",
+    llm_output={"id": "test-id", "created": 1234567890, "model": "gpt-3.5-turbo"},
+)
 
-def test_chat_completions_with_function_call():
-    """Test chat completions with function calls."""
-    message_history = [
-        {"role": "user", "content": "What's the weather in New York?"}
-    ]
-    selected_model = "gpt-4"
-    
-    # Create mock AI message with function call
-    ai_message = AIMessage(content="I'll check the weather for you.")
-    ai_message.additional_kwargs = {
+_FUNCTION_RESULT = _make_ns_result(
+    "I'll check the weather for you.",
+    additional_kwargs={
         "function_call": {
             "name": "get_weather",
-            "arguments": json.dumps({"location": "New York"})
-        }
-    }
-    
-    # Create mock generation
-    mock_generation = ChatGeneration(message=ai_message)
-    mock_generation.finish_reason = "function_call"
-    
-    # Create mock LLMResult
-    mock_llm_result = LLMResult(
-        generations=[[mock_generation]],
-        llm_output={"id": "test-id", "created": 1234567890, "model": selected_model}
-    )
-    
-    # Define tools
-    tools = [
-        {
-            "name": "get_weather", 
-            "description": "Get the current weather in a location",
-            "args": {
-                "location": {"type": "string", "description": "The city and state, e.g. San Francisco, CA"}
-            }
+            "arguments": _WEATHER_ARGS
         }
-    ]
-
-    provider = LangchainChatProvider()
-    
-    # Mock the ChatOpenAI.generate method
-    with patch.object(
-        ChatOpenAI,
-        'generate',
-        return_value=mock_llm_result
-    ) as mock_generate:
-        response = provider.chat_completions_create(
-            messages=message_history,
-            model=selected_model,
-            tools=tools
-        )
-
-        # Check that the function call is in the response
-        assert response.choices[0].message.function_call is not None
-        assert response.choices[0].message.function_call["name"] == "get_weather"
-        assert json.loads(response.choices[0].message.function_call["arguments"])["location"] == "New York"
-        assert response.choices[0].finish_reason == "function_call"
+    },
+    finish_reason="function_call",
+    llm_output={"id": "test-id", "created": 1234567890, "model": "gpt-4"},
+)
 
-
-def test_chat_completions_with_tool_calls():
-    """Test chat completions with tool calls (new format)."""
-    message_history = [
-        {"role": "user", "content": "Book a flight to New York and reserve a hotel"}
-    ]
-    selected_model = "gpt-4"
-    
-    # Create mock AI message with tool calls
-    ai_message = AIMessage(content="I'll help you book a flight and hotel.")
-    ai_message.additional_kwargs = {
+_TOOL_RESULT = _make_ns_result(
+    "I'll help you book a flight and hotel.",
+    additional_kwargs={
         "tool_calls": [
             {
                 "id": "call_1",
                 "type": "function",
                 "function": {
                     "name": "book_flight",
-                    "arguments": json.dumps({"destination": "New York", "date": "2023-12-15"})
+                    "arguments": _FLIGHT_ARGS
                 }
             },
             {
@@ -167,100 +219,134 @@ def test_chat_completions_with_tool_calls():
                 "type": "function",
                 "function": {
                     "name": "book_hotel",
-                    "arguments": json.dumps({"city": "New York", "check_in": "2023-12-15", "nights": 3})
+                    "arguments": _HOTEL_ARGS
                 }
             }
         ]
-    }
-    
-    # Create mock generation
-    mock_generation = ChatGeneration(message=ai_message)
-    mock_generation.finish_reason = "tool_calls"
-    
-    # Create mock LLMResult
-    mock_llm_result = LLMResult(
-        generations=[[mock_generation]],
-        llm_output={"id": "test-id", "created": 1234567890, "model": selected_model}
+    },
+    finish_reason="tool_calls",
+    llm_output={"id": "test-id", "created": 1234567890, "model": "gpt-4"},
+)
+
+
+# One generate stub serves every success case, dispatching on the sentinel
+# the test puts in its user message.
+_RESPONSES = {
+    "basic": _BASIC_RESULT,
+    "function-call": _FUNCTION_RESULT,
+    "tool-calls": _TOOL_RESULT,
+}
+
+
+def _check_basic(response):
+    assert response.choices[0].message.content == "Hello! How can I help you today?"
+    assert response.model == "gpt-3.5-turbo"
+    assert response.choices[0].finish_reason == "stop"
+
+
+def _check_function_call(response):
+    assert response.choices[0].message.function_call is not None
+    assert response.choices[0].message.function_call["name"] == "get_weather"
+    assert response.choices[0].message.function_call["arguments"] == _WEATHER_ARGS
+    assert response.choices[0].finish_reason == "function_call"
+
+
+def _check_tool_calls(response):
+    assert response.choices[0].message.tool_calls is not None
+    assert len(response.choices[0].message.tool_calls) == 2
+    assert response.choices[0].message.tool_calls[0]["function"]["name"] == "book_flight"
+    assert response.choices[0].message.tool_calls[1]["function"]["name"] == "book_hotel"
+    assert response.choices[0].finish_reason == "tool_calls"
+
+
+@pytest.fixture
+def dispatching_generate():
+    """Install the sentinel-dispatching generate stub for one test.
+
+    The stub looks up the canned result by the sentinel in the last user
+    message and records each batch so tests can assert on call counts.
+    Function-scoped so the patch's lifetime matches the tests that request
+    it — a module-wide swap would leak the stub into unrelated tests.
+    """
+    calls = []
+
+    def fake_generate(self, batch, *args, **kwargs):
+        calls.append(batch)
+        return _RESPONSES[batch[0][-1].content]
+
+    with _swap(_lc().ChatOpenAI, 'generate', fake_generate):
+        yield calls
+
+
+# The basic/function-call/tool-call tests shared the same build-stub-assert
+# scaffolding; one parametrized test runs the shape-specific checks while
+# sharing the module-scoped provider and the canned results across cases.
+@pytest.mark.parametrize("sentinel, model, tools, check", [
+    pytest.param("basic", "gpt-3.5-turbo", None, _check_basic, id="basic"),
+    pytest.param("function-call", "gpt-4", _WEATHER_TOOLS, _check_function_call,
+                 id="function-call"),
+    pytest.param("tool-calls", "gpt-4", _BOOKING_TOOLS, _check_tool_calls,
+                 id="tool-calls"),
+])
+def test_chat_completions_create(provider, dispatching_generate,
+                                 sentinel, model, tools, check):
+    """Test chat completions across the basic/function-call/tool-call shapes."""
+    response = provider.chat_completions_create(
+        messages=[{"role": "user", "content": sentinel}],
+        model=model,
+        temperature=0.75,
+        tools=tools,
     )
-    
-    # Define tools
-    tools = [
-        {
-            "name": "book_flight", 
-            "description": "Book a flight to a destination",
-            "args": {
-                "destination": {"type": "string", "description": "City name"},
-                "date": {"type": "string", "description": "Date in YYYY-MM-DD format"}
-            }
-        },
-        {
-            "name": "book_hotel", 
-            "description": "Book a hotel in a city",
-            "args": {
-                "city": {"type": "string", "description": "City name"},
-                "check_in": {"type": "string", "description": "Check-in date"},
-                "nights": {"type": "integer", "description": "Number of nights"}
-            }
-        }
-    ]
 
-    provider = LangchainChatProvider()
-    
-    # Mock the ChatOpenAI.generate method
-    with patch.object(
-        ChatOpenAI,
-        'generate',
-        return_value=mock_llm_result
-    ) as mock_generate:
+    # Check that generate was called exactly once
+    assert len(dispatching_generate) == 1
+    check(response)
+
+
+def test_chat_completions_real_langchain_objects(provider):
+    """Guard the normalizer contract with real pydantic result objects."""
+    llm_result = _make_result(
+        "Hello! How can I help you today?",
+        llm_output={"id": "test-id", "created": 1234567890, "model": "gpt-3.5-turbo"},
+    )
+    mock_generate = _Recorder(ret=llm_result)
+    with _swap(_lc().ChatOpenAI, 'generate', mock_generate):
         response = provider.chat_completions_create(
-            messages=message_history,
-            model=selected_model,
-            tools=tools
+            messages=[{"role": "user", "content": "Hello!"}],
+            model="gpt-3.5-turbo",
         )
 
-        # Check that the tool calls are in the response
-        assert response.choices[0].message.tool_calls is not None
-        assert len(response.choices[0].message.tool_calls) == 2
-        assert response.choices[0].message.tool_calls[0]["function"]["name"] == "book_flight"
-        assert response.choices[0].message.tool_calls[1]["function"]["name"] == "book_hotel"
-        assert response.choices[0].finish_reason == "tool_calls"
+    _check_basic(response)
 
 
-def test_error_handling():
-    """Test error handling in the provider."""
-    provider = LangchainChatProvider()
-    
-    # Mock ChatOpenAI.generate to raise an exception
-    with patch.object(
-        ChatOpenAI,
-        'generate',
-        side_effect=Exception("Model connection failed")
-    ):
-        with pytest.raises(LLMError) as excinfo:
-            provider.chat_completions_create(
-                messages=[{"role": "user", "content": "Hello"}],
-                model="gpt-3.5-turbo"
-            )
-        
-        assert "Error in Langchain chat completion" in str(excinfo.value)
-
-
-def test_no_model_provided():
-    """Test error when no model is provided."""
-    provider = LangchainChatProvider()
-    
-    with pytest.raises(LLMError) as excinfo:
+# Both error tests built the same call and asserted on an LLMError message;
+# one parametrized test branches on the setup instead.
+@pytest.mark.parametrize("setup, expected", [
+    pytest.param("generate-raises", "Error in Langchain chat completion",
+                 id="generate-raises"),
+    pytest.param("no-model", "No model specified", id="no-model"),
+])
+def test_errors(provider, setup, expected):
+    """Test that provider failures surface as LLMError."""
+    if setup == "generate-raises":
+        model = "gpt-3.5-turbo"
+        stub = _swap(_lc().ChatOpenAI, 'generate',
+                     _Recorder(exc=Exception("Model connection failed")))
+    else:
+        model = None
+        stub = nullcontext()
+
+    with stub, pytest.raises(LLMError) as excinfo:
         provider.chat_completions_create(
             messages=[{"role": "user", "content": "Hello"}],
-            model=None
+            model=model
         )
-    
-    assert "No model specified" in str(excinfo.value)
+
+    assert expected in str(excinfo.value)
 
 
-def test_message_conversion():
+def test_message_conversion(provider):
     """Test that messages are correctly converted to Langchain format."""
-    provider = LangchainChatProvider()
     
     # Create messages of different types
     messages = [
@@ -270,24 +356,27 @@ def test_message_conversion():
         {"role": "function", "name": "get_time", "content": '{"time": "12:00"}'}
     ]
     
-    # Mock ChatOpenAI to capture the messages
-    mock_generate = MagicMock(return_value=LLMResult(
-        generations=[[ChatGeneration(message=AIMessage(content="Hello"))]],
-        llm_output={}
-    ))
-    
-    with patch.object(ChatOpenAI, 'generate', mock_generate):
+    # Capture the messages with a plain function; a class-level function
+    # binds like a real method, so it takes self.
+    captured = []
+
+    def fake_generate(self, batch, *args, **kwargs):
+        captured.append(batch)
+        return _make_ns_result("Hello")
+
+    with _swap(_lc().ChatOpenAI, 'generate', fake_generate):
         provider.chat_completions_create(
             messages=messages,
             model="gpt-3.5-turbo"
         )
-        
-        # Get the messages passed to generate
-        call_args = mock_generate.call_args[0][0]
-        
-        # Verify the message types
-        assert isinstance(call_args[0], SystemMessage)
-        assert isinstance(call_args[1], HumanMessage)
-        assert isinstance(call_args[2], AIMessage)
-        assert call_args[3].type == "function"
-        assert call_args[3].name == "get_time"
\ No newline at end of file
+
+    # generate takes a batch of message lists; ours is the only entry.
+    [langchain_messages] = captured[0]
+
+    # Verify the message types
+    lc = _lc()
+    assert isinstance(langchain_messages[0], lc.SystemMessage)
+    assert isinstance(langchain_messages[1], lc.HumanMessage)
+    assert isinstance(langchain_messages[2], lc.AIMessage)
+    assert langchain_messages[3].type == "function"
+    assert langchain_messages[3].name == "get_time"
\ No newline at end of file